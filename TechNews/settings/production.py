@@ -1,7 +1,13 @@
 import os
+from django.core.exceptions import ImproperlyConfigured
 from .base import *
 import dj_database_url
 
+# Scrape jobs, locks, single-flight and the known-URL index are shared between the
+# web and Celery processes through the cache, a per-process memory cache breaks them
+if not os.getenv('REDIS_CACHE_URL'):
+    raise ImproperlyConfigured('REDIS_CACHE_URL must be set in production')
+
 ALLOWED_HOSTS = ['*']
 
 DEBUG = False
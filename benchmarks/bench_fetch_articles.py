@@ -0,0 +1,60 @@
+"""
+Wall-clock benchmark of sequential vs concurrent article fetching.
+
+Usage:
+    python -m benchmarks.bench_fetch_articles [--articles 20] [--delay 0.2] [--workers 8] [--rate 1000]
+"""
+import argparse
+import os
+import time
+
+import django
+from django.conf import settings
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TechNews.settings.base')
+django.setup()
+
+from utility import http_client  # noqa: E402
+from utility.scraper import fetch_articles_details  # noqa: E402
+from utility.tests.stand_in_site import StandInSite  # noqa: E402
+
+
+def run(urls, max_workers):
+    started = time.perf_counter()
+    news_items = fetch_articles_details(urls, max_workers=max_workers)
+    return time.perf_counter() - started, len(news_items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=20)
+    parser.add_argument('--delay', type=float, default=0.2, help='Simulated per-article latency in seconds')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--rate', type=float, default=1000, help='Per-host rate limit (requests per second)')
+    args = parser.parse_args()
+
+    # The stand-in site is local, so the politeness limit is lifted by default
+    # to measure concurrency rather than pacing.
+    settings.SCRAPER_RATE_LIMIT = args.rate
+    settings.SCRAPER_RATE_BURST = max(1, int(args.rate))
+
+    with StandInSite(articles_per_page=args.articles, article_delay=args.delay) as site:
+        urls = site.article_urls()
+
+        sequential, count = run(urls, max_workers=1)
+        print(f"sequential       : {sequential:.2f}s ({count} articles)")
+
+        concurrent, count = run(urls, max_workers=args.workers)
+        print(f"concurrent ({args.workers:>2}) : {concurrent:.2f}s ({count} articles)")
+
+        print(f"speedup          : {sequential / concurrent:.1f}x")
+
+        for host, stats in http_client.connection_stats().items():
+            print(f"pool {host}: {stats['requests']} requests over {stats['connections']} connections")
+
+        for host, stats in http_client.retry_stats().items():
+            print(f"retry {host}: {stats['retries']} retries, {stats['drops']} drops, {stats['throttled']} throttled")
+
+
+if __name__ == '__main__':
+    main()
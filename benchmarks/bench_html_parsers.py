@@ -0,0 +1,60 @@
+"""
+Per-page parse and extraction cost of each HTML parser backend.
+
+Runs parse_article_html over the saved article pages in utility/tests/pages
+and over a synthetic long article, once per available backend.
+
+Usage:
+    python -m benchmarks.bench_html_parsers [--repeat 50] [--paragraphs 400]
+"""
+import argparse
+import os
+import time
+from pathlib import Path
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TechNews.settings.base')
+django.setup()
+
+from utility.html_parsers import PARSER_BACKENDS  # noqa: E402
+from utility.scraper import parse_article_html  # noqa: E402
+
+PAGES_DIR = Path(__file__).resolve().parent.parent / 'utility' / 'tests' / 'pages'
+
+
+def build_long_article(paragraphs):
+    page = (PAGES_DIR / 'digiato_article.html').read_text(encoding='utf-8')
+    extra = ''.join(
+        f'<p>پاراگراف {i}: هوش مصنوعی و تراشه‌های جدید بازار فناوری را دگرگون کرده‌اند و رقابت شرکت‌ها بیشتر شده است.</p>'
+        f'<div class="ads-container"><p>آگهی {i}</p></div>'
+        for i in range(paragraphs)
+    )
+    return page.replace('<div class="b-content">', f'<div class="b-content">{extra}', 1)
+
+
+def measure(html_content, backend, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse_article_html(html_content, 'https://digiato.com/bench', parser=backend)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--paragraphs', type=int, default=400)
+    args = parser.parse_args()
+
+    pages = {path.name: path.read_text(encoding='utf-8') for path in sorted(PAGES_DIR.glob('*.html'))}
+    pages['synthetic long article'] = build_long_article(args.paragraphs)
+
+    backends = [name for name, backend in sorted(PARSER_BACKENDS.items()) if backend.is_available()]
+    print(f"{'page':<32}{'KB':>6}" + ''.join(f"{name:>14}" for name in backends))
+    for name, html_content in pages.items():
+        timings = [measure(html_content, backend, args.repeat) for backend in backends]
+        print(f"{name:<32}{len(html_content.encode()) // 1024:>6}" + ''.join(f"{t * 1000:>11.2f} ms" for t in timings))
+
+
+if __name__ == '__main__':
+    main()
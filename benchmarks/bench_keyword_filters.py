@@ -0,0 +1,155 @@
+"""
+Keyword filtering time of ScrapedNewsView.apply_filters, before and after the
+compiled single-pass matcher.
+
+"before" replays the previous behaviour on article dictionaries: every filter
+pass lowercases title, content and text again for every keyword. "after" runs
+on ScrapedArticle records, whose text was lowercased once when scraped.
+
+Usage:
+    python -m benchmarks.bench_keyword_filters [--articles 100] [--keywords 1 2 3 4 5 50 400] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TechNews.settings.base')
+django.setup()
+
+from django.http import QueryDict  # noqa: E402
+from news.views.scrap_news_view import ScrapedNewsView  # noqa: E402
+from utility.scraped_article import ScrapedArticle  # noqa: E402
+
+VOCABULARY = (
+    'فناوری هوش مصنوعی گوشی هوشمند اپل سامسونگ گوگل مایکروسافت پردازنده تراشه باتری شارژ '
+    'اینترنت ماهواره استارتاپ سرمایه گذاری امنیت سایبری حریم خصوصی بازی کنسول خودرو برقی '
+    'Apple Google Samsung Nvidia OpenAI Tesla Android iOS Windows Linux cloud chip GPU'
+).split()
+
+
+def build_articles(count, words_per_article, rng):
+    return [
+        ScrapedArticle(
+            title=' '.join(rng.choices(VOCABULARY, k=12)),
+            text=' '.join(rng.choices(VOCABULARY, k=words_per_article)),
+            source=f"https://digiato.com/article/{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def build_query(keyword_count, rng):
+    """
+    A typical query: one common keyword, then an exclusion that rarely occurs,
+    then any-of keywords (at most three of which occur) and exclusions in equal
+    parts, so most articles go through every filter
+    """
+    query_params = QueryDict(mutable=True)
+    query_params['keyword'] = VOCABULARY[0]
+    remaining = keyword_count - 1
+    if remaining:
+        query_params['exclude_keyword'] = f"{VOCABULARY[1]}{rng.randint(0, 99)}"
+        remaining -= 1
+
+    any_of_count = (remaining + 1) // 2
+    common_count = min(3, any_of_count)
+    any_of = [f"{word}{rng.randint(0, 99)}" for word in rng.choices(VOCABULARY, k=any_of_count - common_count)]
+    any_of += rng.sample(VOCABULARY, common_count)
+    excluded = [f"{word}{rng.randint(0, 99)}" for word in rng.choices(VOCABULARY, k=remaining - any_of_count)]
+    if any_of:
+        query_params['keywords'] = ','.join(any_of)
+    if excluded:
+        query_params['exclude_keywords'] = ','.join(excluded)
+    return query_params
+
+
+def apply_filters_before(news_items, query_params):
+    filtered_items = news_items
+
+    keyword = query_params.get('keyword')
+    if keyword:
+        filtered_items = [
+            item for item in filtered_items
+            if keyword.lower() in item.get('title', '').lower() or
+               keyword.lower() in item.get('content', '').lower() or
+               keyword.lower() in item.get('text', '').lower()
+        ]
+
+    keywords = query_params.get('keywords')
+    if keywords:
+        keyword_list = [k.strip().lower() for k in keywords.split(',')]
+        filtered_items = [
+            item for item in filtered_items
+            if any(
+                k in item.get('title', '').lower() or
+                k in item.get('content', '').lower() or
+                k in item.get('text', '').lower()
+                for k in keyword_list
+            )
+        ]
+
+    exclude_keyword = query_params.get('exclude_keyword')
+    if exclude_keyword:
+        filtered_items = [
+            item for item in filtered_items
+            if exclude_keyword.lower() not in item.get('title', '').lower() and
+               exclude_keyword.lower() not in item.get('content', '').lower() and
+               exclude_keyword.lower() not in item.get('text', '').lower()
+        ]
+
+    exclude_keywords = query_params.get('exclude_keywords')
+    if exclude_keywords:
+        exclude_keyword_list = [k.strip().lower() for k in exclude_keywords.split(',')]
+        filtered_items = [
+            item for item in filtered_items
+            if not any(
+                k in item.get('title', '').lower() or
+                k in item.get('content', '').lower() or
+                k in item.get('text', '').lower()
+                for k in exclude_keyword_list
+            )
+        ]
+
+    return filtered_items
+
+
+def measure(func, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=100)
+    parser.add_argument('--words', type=int, default=1200, help='Words per article body')
+    parser.add_argument('--keywords', type=int, nargs='+', default=[1, 2, 3, 4, 5, 50, 400])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    news_items = build_articles(args.articles, args.words, rng)
+    news_dicts = [item.as_dict() for item in news_items]
+    view = ScrapedNewsView()
+
+    size = sum(len(item.text) for item in news_items) // 1024
+    print(f"{args.articles} articles ({size} KB)")
+    for keyword_count in args.keywords:
+        query_params = build_query(keyword_count, rng)
+        before, expected = measure(lambda: apply_filters_before(news_dicts, query_params), args.repeat)
+        after, result = measure(lambda: view.apply_filters(news_items, query_params), args.repeat)
+        assert [item.source for item in result] == [item['source'] for item in expected], (
+            'matcher output differs from the previous filters'
+        )
+        print(
+            f"{keyword_count:>3} keywords, {len(result):>3} kept: "
+            f"before {before * 1000:.1f}ms, after {after * 1000:.1f}ms, speedup {before / after:.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
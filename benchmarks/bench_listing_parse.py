@@ -0,0 +1,90 @@
+"""
+Parse time and allocation of listing-page extraction, before and after the
+single-parse pipeline.
+
+"before" replays the previous behaviour: one full BeautifulSoup tree for the
+JSON-LD lookup and, when that fails, a second full tree for the HTML fallback.
+
+Usage:
+    python -m benchmarks.bench_listing_parse [--boxes 60] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TechNews.settings.base')
+django.setup()
+
+from bs4 import BeautifulSoup  # noqa: E402
+from utility.scraper import extract_listing, extract_article_links_from_html  # noqa: E402
+
+
+def build_listing_page(boxes, with_jsonld):
+    urls = [f"https://digiato.com/article/news-{i}" for i in range(boxes)]
+    item_list = {
+        '@type': 'ItemList',
+        'itemListElement': [{'@type': 'ListItem', 'position': i + 1, 'url': url} for i, url in enumerate(urls)],
+    }
+    post_boxes = ''.join(
+        f'<article class="b-post-box"><a class="b-post-box__link" href="{url}">'
+        f'<img src="/img/{i}.jpg" alt="تصویر {i}"><h3 class="b-post-box__title">عنوان خبر شماره {i}</h3></a>'
+        f'<p class="b-post-box__excerpt">{"خلاصه‌ای از خبر فناوری و هوش مصنوعی. " * 8}</p>'
+        f'<ul class="b-post-box__meta"><li>نویسنده</li><li>۱۴۰۴/۰۲/۱۸</li><li>۵ دقیقه</li></ul></article>'
+        for i, url in enumerate(urls)
+    )
+    navigation = ''.join(f'<li><a href="/topic/{i}">موضوع {i}</a></li>' for i in range(150))
+    jsonld = f'<script type="application/ld+json">{json.dumps(item_list)}</script>' if with_jsonld else ''
+    return (
+        f'<html><head><title>دیجیاتو</title>{jsonld}<script>var x = 1;</script></head><body>'
+        f'<header><nav><ul>{navigation}</ul></nav></header>'
+        f'<main><div class="b-archive-posts">{post_boxes}</div></main>'
+        f'<footer><ul>{navigation}</ul></footer></body></html>'
+    )
+
+
+def extract_listing_before(html_content):
+    soup = BeautifulSoup(html_content, 'html.parser')
+    for script in soup.find_all('script', type='application/ld+json'):
+        data = json.loads(script.string)
+        if data.get('@type') == 'ItemList':
+            return [item['url'] for item in data['itemListElement']], []
+    return [], extract_article_links_from_html(html_content)
+
+
+def measure(func, html_content, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(html_content)
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    func(html_content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--boxes', type=int, default=60)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    for with_jsonld in (True, False):
+        html_content = build_listing_page(args.boxes, with_jsonld)
+        before = measure(extract_listing_before, html_content, args.repeat)
+        after = measure(extract_listing, html_content, args.repeat)
+        assert extract_listing_before(html_content) == extract_listing(html_content)
+
+        label = 'JSON-LD page ' if with_jsonld else 'HTML fallback'
+        print(f"{label} ({len(html_content) // 1024} KB)")
+        print(f"  before: {before[0] * 1000:7.1f} ms  peak {before[1] / 1024:8.0f} KB")
+        print(f"  after : {after[0] * 1000:7.1f} ms  peak {after[1] / 1024:8.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Keyword search time of the news list filters at a million rows: the icontains
+keyword filters against the full-text search on the GIN-indexed search_vector.
+
+Needs Postgres. Runs in a throwaway test database of the settings module that
+is created, filled with generated articles and dropped again (--keepdb keeps
+it, and its rows, for the next run).
+
+Usage:
+    python -m benchmarks.bench_news_search [--rows 1000000] [--words 80] [--repeat 5] [--keepdb]
+"""
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TechNews.settings.local')
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.http import QueryDict  # noqa: E402
+from news.filters import NewsFilter  # noqa: E402
+from news.models.news_model import News  # noqa: E402
+
+BASE_WORDS = (
+    'فناوری هوش مصنوعی گوشی هوشمند اپل سامسونگ گوگل مایکروسافت پردازنده تراشه باتری شارژ '
+    'اینترنت ماهواره استارتاپ سرمایه گذاری امنیت سایبری حریم خصوصی بازی کنسول خودرو برقی '
+    'Apple Google Samsung Nvidia OpenAI Tesla Android iOS Windows Linux cloud chip GPU'
+).split()
+
+# Early words are frequent and late words rare: word i is drawn with a skewed random index
+VOCABULARY = BASE_WORDS + [f"{word}{n}" for n in range(1, 20) for word in BASE_WORDS]
+
+INSERT_SQL = """
+INSERT INTO news_news (id, title, text, source, content_hash, created_at, updated_at)
+SELECT
+    gen_random_uuid(),
+    (SELECT string_agg(words[1 + floor(power(random(), 3) * array_length(words, 1))::int], ' ')
+     FROM generate_series(1, 8 + i %% 2)),
+    (SELECT string_agg(words[1 + floor(power(random(), 3) * array_length(words, 1))::int], ' ')
+     FROM generate_series(1, %s + i %% 2)),
+    'https://digiato.com/bench-' || i,
+    '',
+    now() - i * interval '1 second',
+    now()
+FROM generate_series(%s, %s) AS i, (SELECT %s::text[] AS words) AS vocabulary
+"""
+
+
+def populate(rows, words, chunk_size=100_000):
+    existing = News.objects.count()
+    with connection.cursor() as cursor:
+        for start in range(existing, rows, chunk_size):
+            stop = min(start + chunk_size, rows)
+            started = time.perf_counter()
+            cursor.execute(INSERT_SQL, [words, start + 1, stop, VOCABULARY])
+            print(f"  inserted {stop:,} rows ({time.perf_counter() - started:.1f}s)")
+        cursor.execute('ANALYZE news_news')
+
+
+def measure(func, repeat):
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def list_page(params):
+    """
+    The queries of one news list page: the page itself and its count
+    """
+    queryset = NewsFilter(QueryDict(params), queryset=News.objects.order_by('-created_at')).qs
+    return len(list(queryset[:10])), queryset.count()
+
+
+def plan(params):
+    queryset = NewsFilter(QueryDict(params), queryset=News.objects.order_by('-created_at')).qs
+    nodes = ('Seq Scan', 'Bitmap Index Scan', 'Index Scan')
+    return next((node for node in nodes if node in queryset.explain()), 'other')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--words', type=int, default=80, help='Words per article body')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--keepdb', action='store_true')
+    parser.add_argument('--query', action='append', help='Word to search (default: a frequent and a rare word)')
+    args = parser.parse_args()
+
+    if connection.vendor != 'postgresql':
+        parser.error('this benchmark needs a Postgres database')
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=args.keepdb)
+    try:
+        print(f"Populating {args.rows:,} rows")
+        populate(args.rows, args.words)
+
+        for query in args.query or [VOCABULARY[5], VOCABULARY[-1]]:
+            before, (_, count) = measure(lambda: list_page(f"keywords={query}"), args.repeat)
+            after, (_, search_count) = measure(lambda: list_page(f"search={query}"), args.repeat)
+            print(f"\n{query!r}: icontains {count:,} rows, full-text {search_count:,} rows")
+            print(f"before : {before * 1000:.1f}ms ({plan(f'keywords={query}')})")
+            print(f"after  : {after * 1000:.1f}ms ({plan(f'search={query}')})")
+            print(f"speedup: {before / after:.1f}x")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+
+
+if __name__ == '__main__':
+    main()
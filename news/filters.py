@@ -1,6 +1,7 @@
-from django.db.models import Q
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F, Q
 from django_filters import rest_framework as filters
-from news.models.news_model import News
+from news.models.news_model import News, SEARCH_CONFIG
 
 
 class NewsFilter(filters.FilterSet):
@@ -13,6 +14,8 @@ class NewsFilter(filters.FilterSet):
     exclude_keyword = filters.CharFilter(method='filter_exclude_keyword')
     exclude_keywords = filters.CharFilter(method='filter_exclude_keywords')
 
+    search = filters.CharFilter(method='filter_search')
+
     def filter_tags_list(self, queryset, name, value):
         tags = [tag.strip() for tag in value.split(',')]
         return queryset.filter(tags__name__in=tags).distinct()
@@ -28,11 +31,28 @@ class NewsFilter(filters.FilterSet):
         return queryset.exclude(text__icontains=value)
 
     def filter_exclude_keywords(self, queryset, name, value):
+        # One NOT (... OR ...) predicate instead of one exclude() per keyword
         keywords = [keyword.strip() for keyword in value.split(',')]
+        q_objects = Q()
         for keyword in keywords:
-            queryset = queryset.exclude(text__icontains=keyword)
-        return queryset
+            q_objects |= Q(text__icontains=keyword)
+        return queryset.exclude(q_objects)
+
+    def filter_search(self, queryset, name, value):
+        """
+        Full-text search on the indexed search_vector, best matches first
+
+        The value uses web search syntax ("quoted phrase", or, -excluded) and
+        every result is annotated with its rank and a highlighted headline.
+        """
+        query = SearchQuery(value, config=SEARCH_CONFIG, search_type='websearch')
+        return queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query),
+            headline=SearchHeadline(
+                'text', query, config=SEARCH_CONFIG, start_sel='<mark>', stop_sel='</mark>', max_words=35, min_words=15
+            ),
+        ).order_by('-rank', '-created_at')
 
     class Meta:
         model = News
-        fields = ['tags', 'tags_list', 'keyword', 'keywords', 'exclude_keyword', 'exclude_keywords']
+        fields = ['tags', 'tags_list', 'keyword', 'keywords', 'exclude_keyword', 'exclude_keywords', 'search']
@@ -0,0 +1,102 @@
+import logging
+from django.conf import settings
+from django.db import transaction
+from news.models.news_model import News, make_excerpt
+from news.models.tag_model import Tag
+from utility.counts import invalidate_counts
+
+logger = logging.getLogger(__name__)
+
+
+def ingest_articles(news_items, batch_size=None):
+    """
+    Persist scraped news items with a bulk upsert on their source URL
+
+    Every batch runs in one transaction with a fixed number of queries, no
+    matter how many articles it holds. Articles whose content hash is unchanged
+    are skipped.
+
+    Args:
+        news_items: List of ScrapedArticle records
+        batch_size: Number of articles written per transaction (default: settings.SCRAPER_INGEST_BATCH_SIZE)
+
+    Returns:
+        Dictionary with the number of saved and unchanged articles
+    """
+    if batch_size is None:
+        batch_size = getattr(settings, 'SCRAPER_INGEST_BATCH_SIZE', 500)
+
+    # The same URL twice in one upsert statement is rejected by Postgres, keep the latest
+    unique_items = {}
+    for item in news_items:
+        if item.source and item.title:
+            unique_items[item.source] = item
+    news_items = list(unique_items.values())
+
+    stats = {'saved': 0, 'unchanged': 0}
+    for start in range(0, len(news_items), batch_size):
+        batch_stats = ingest_batch(news_items[start:start + batch_size])
+        stats['saved'] += batch_stats['saved']
+        stats['unchanged'] += batch_stats['unchanged']
+
+    # Bulk upserts send no model signals
+    if stats['saved']:
+        invalidate_counts(News)
+
+    logger.info(f"Ingested {stats['saved']} articles, skipped {stats['unchanged']} unchanged")
+    return stats
+
+
+@transaction.atomic
+def ingest_batch(news_items):
+    """
+    Upsert one batch of news items and link their tags
+
+    Args:
+        news_items: List of ScrapedArticle records with unique sources
+
+    Returns:
+        Dictionary with the number of saved and unchanged articles
+    """
+    existing_hashes = dict(
+        News.objects.filter(source__in=[item.source for item in news_items]).values_list('source', 'content_hash')
+    )
+    changed_items = [item for item in news_items if existing_hashes.get(item.source) != item.content_hash]
+
+    if not changed_items:
+        return {'saved': 0, 'unchanged': len(news_items)}
+
+    News.objects.bulk_create(
+        [
+            News(
+                title=item.title[:255],
+                text=item.text,
+                excerpt=make_excerpt(item.text),
+                source=item.source,
+                content_hash=item.content_hash,
+            )
+            for item in changed_items
+        ],
+        update_conflicts=True,
+        unique_fields=['source'],
+        update_fields=['title', 'text', 'excerpt', 'content_hash', 'updated_at'],
+    )
+
+    tag_names = {name[:255] for item in changed_items for name in item.tags}
+    if tag_names:
+        Tag.objects.bulk_create([Tag(name=name) for name in tag_names], ignore_conflicts=True)
+        tag_ids = dict(Tag.objects.filter(name__in=tag_names).values_list('name', 'id'))
+
+        news_ids = dict(
+            News.objects.filter(source__in=[item.source for item in changed_items]).values_list('source', 'id')
+        )
+        News.tags.through.objects.bulk_create(
+            [
+                News.tags.through(news_id=news_ids[item.source], tag_id=tag_ids[name[:255]])
+                for item in changed_items
+                for name in set(item.tags)
+            ],
+            ignore_conflicts=True,
+        )
+
+    return {'saved': len(changed_items), 'unchanged': len(news_items) - len(changed_items)}
@@ -0,0 +1,80 @@
+import hashlib
+import logging
+from django.conf import settings
+from django.core.cache import caches
+from news.models.news_model import News
+
+logger = logging.getLogger(__name__)
+
+
+class KnownUrlIndex:
+    """
+    Seen-set of article URLs that were already ingested.
+
+    URLs are stored as fixed-size hashed keys in the Django cache (Redis in
+    production), so every worker shares one index and a whole listing page is
+    checked with a single get_many round trip. The index is warmed from
+    News.source the first time it is used.
+    """
+    key_prefix = 'news:known-url:'
+    warmed_key = 'news:known-url:warmed'
+    warm_chunk_size = 2000
+
+    def __init__(self, cache_alias='default', timeout=None):
+        self.cache = caches[cache_alias]
+        self.timeout = timeout or getattr(settings, 'SCRAPER_KNOWN_URL_TTL', 60 * 60 * 24 * 30)
+
+    def make_key(self, url):
+        return self.key_prefix + hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def warm(self, force=False):
+        """
+        Load every stored News.source into the index
+
+        Args:
+            force: Reload even when the index was already warmed
+        """
+        if not force and self.cache.get(self.warmed_key):
+            return
+
+        count = 0
+        chunk = []
+        for source in News.objects.values_list('source', flat=True).iterator(chunk_size=self.warm_chunk_size):
+            chunk.append(source)
+            if len(chunk) >= self.warm_chunk_size:
+                self.add(chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            self.add(chunk)
+            count += len(chunk)
+
+        # Re-warm daily so entries evicted from the cache come back
+        self.cache.set(self.warmed_key, True, min(self.timeout, 60 * 60 * 24))
+        logger.info(f"Warmed known URL index with {count} URLs")
+
+    def add(self, urls):
+        """
+        Mark URLs as known
+
+        Args:
+            urls: Iterable of article URLs
+        """
+        keys = {self.make_key(url): 1 for url in urls}
+        if keys:
+            self.cache.set_many(keys, self.timeout)
+
+    def unknown(self, urls):
+        """
+        Filter out the URLs that are already known
+
+        Args:
+            urls: List of candidate article URLs
+
+        Returns:
+            List of unknown URLs in their original order
+        """
+        self.warm()
+        keys = {url: self.make_key(url) for url in urls}
+        found = self.cache.get_many(keys.values())
+        return [url for url in urls if keys[url] not in found]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:54
+
+from django.db import migrations, models
+
+
+def merge_duplicate_sources(apps, schema_editor):
+    """
+    Keep one row per source before the column becomes unique
+
+    The most recently updated row of each source is kept, and the tags of
+    the other rows are moved onto it before they are deleted.
+    """
+    News = apps.get_model('news', 'News')
+    duplicated = (
+        News.objects.values('source').annotate(rows=models.Count('id')).filter(rows__gt=1).values_list('source', flat=True)
+    )
+    for source in list(duplicated):
+        keeper, *duplicates = News.objects.filter(source=source).order_by('-updated_at', '-created_at')
+        for news in duplicates:
+            keeper.tags.add(*news.tags.all())
+            news.delete()
+
+    # Deleted rows leave deferred foreign key checks that block the ALTER TABLE below on Postgres
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        schema_editor.execute('SET CONSTRAINTS ALL DEFERRED')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='news',
+            options={'verbose_name_plural': 'news'},
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.RunPython(merge_duplicate_sources, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='news',
+            name='source',
+            field=models.CharField(max_length=500, unique=True),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Keeps search_vector in sync on every insert and update, including the bulk
+# upserts of news.ingest, which bypass Model.save
+CREATE_TRIGGER = """
+CREATE FUNCTION news_news_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.text, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER news_news_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, text ON news_news
+FOR EACH ROW EXECUTE FUNCTION news_news_search_vector_update();
+
+UPDATE news_news SET title = title;
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS news_news_search_vector_trigger ON news_news;
+DROP FUNCTION IF EXISTS news_news_search_vector_update();
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_TRIGGER)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TRIGGER)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_news_content_hash_unique_source'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        # Backfill before indexing, so the GIN index is built once instead of row by row
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+        migrations.AddIndex(
+            model_name='news',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='news_search_vector_gin'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:55
+
+from django.db import migrations, models
+
+
+def make_excerpt(text, length=300):
+    """
+    Excerpt as news.models.news_model.make_excerpt built it when this migration was written
+
+    Copied so later changes to the model helper do not change what this migration stores.
+    """
+    text = ' '.join((text or '').split())
+    if len(text) <= length:
+        return text
+    cut = text[:length - 1]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return f"{cut}…"
+
+
+def backfill_excerpts(apps, schema_editor):
+    News = apps.get_model('news', 'News')
+    batch = []
+    for news in News.objects.only('id', 'text').iterator(chunk_size=1000):
+        news.excerpt = make_excerpt(news.text)
+        batch.append(news)
+        if len(batch) >= 1000:
+            News.objects.bulk_update(batch, ['excerpt'])
+            batch = []
+    if batch:
+        News.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_news_created_at_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', editable=False, max_length=300),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,47 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from .tag_model import Tag
 
+# Text search configuration of search_vector. Postgres ships no Persian
+# stemmer, 'simple' lowercases and splits words without stemming.
+SEARCH_CONFIG = 'simple'
+
+EXCERPT_LENGTH = 300
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """
+    Leading part of an article's text shown in lists
+
+    Args:
+        text: Full article text
+        length: Maximum excerpt length in characters
+
+    Returns:
+        The text with whitespace collapsed, cut on a word boundary with an ellipsis when too long
+    """
+    text = ' '.join((text or '').split())
+    if len(text) <= length:
+        return text
+    cut = text[:length - 1]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return f"{cut}…"
+
 
 class News(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
     text = models.TextField()
-    source = models.CharField(max_length=255)
+    source = models.CharField(max_length=500, unique=True)
+    content_hash = models.CharField(max_length=64, blank=True, default='', editable=False)
+    # Derived from text on every write, lists read it instead of the full text
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, default='', editable=False)
+    # Weighted title (A) and text (B) vector, kept up to date by a database trigger
+    search_vector = SearchVectorField(null=True, editable=False)
     tags = models.ManyToManyField(Tag, related_name='news')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -15,5 +49,21 @@ class News(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.excerpt = make_excerpt(self.text)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'text' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'excerpt'}
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name_plural = 'news'
+        indexes = [
+            # Serves the keyset pagination of the news list
+            models.Index(fields=['-created_at', '-id'], name='news_created_at_id_idx'),
+            GinIndex(fields=['search_vector'], name='news_search_vector_gin'),
+            # icontains compiles to UPPER(column) LIKE UPPER(pattern), these trigram
+            # indexes on the same expressions serve the keyword filters
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='news_title_upper_trgm'),
+            GinIndex(OpClass(Upper('text'), name='gin_trgm_ops'), name='news_text_upper_trgm'),
+        ]
@@ -0,0 +1,61 @@
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+JOB_KEY_PREFIX = 'scrape:job:'
+
+
+def job_timeout():
+    return getattr(settings, 'SCRAPER_JOB_TTL', 3600)
+
+
+def create_job(page_number, topic):
+    """
+    Register a new scrape job
+
+    Args:
+        page_number: Listing page to scrape
+        topic: Topic to scrape
+
+    Returns:
+        The job dictionary
+    """
+    job = {
+        'job_id': uuid.uuid4().hex,
+        'status': PENDING,
+        'page': page_number,
+        'topic': topic,
+        'progress': {'completed': 0, 'total': None},
+        'items': None,
+        'error': None,
+    }
+    save_job(job)
+    return job
+
+
+def get_job(job_id):
+    return cache.get(f"{JOB_KEY_PREFIX}{job_id}")
+
+
+def save_job(job):
+    cache.set(f"{JOB_KEY_PREFIX}{job['job_id']}", job, job_timeout())
+
+
+def update_job(job_id, **fields):
+    """
+    Update fields of a stored job
+
+    Returns:
+        The updated job dictionary, or None when the job expired
+    """
+    job = get_job(job_id)
+    if job is None:
+        return None
+    job.update(fields)
+    save_job(job)
+    return job
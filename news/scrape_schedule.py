@@ -0,0 +1,110 @@
+import hashlib
+import logging
+import time
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveSchedule:
+    """
+    Per-topic polling schedule that follows the upstream change rate.
+
+    Each run that finds new articles halves the polling interval and each run
+    that finds none stretches it by half, within SCRAPER_MIN_INTERVAL and
+    SCRAPER_MAX_INTERVAL. Listing pages are fingerprinted by the hash of their
+    ItemList URLs, so a page identical to the previous run is skipped without
+    looking at its articles.
+
+    The state lives in the Django cache so the beat dispatcher and the workers
+    share it.
+    """
+    key_prefix = 'scrape:schedule:'
+    speedup = 0.5
+    slowdown = 1.5
+
+    def __init__(self, topic, cache_alias='default'):
+        self.cache = caches[cache_alias]
+        self.topic = topic
+        self.min_interval = getattr(settings, 'SCRAPER_MIN_INTERVAL', 30)
+        self.max_interval = getattr(settings, 'SCRAPER_MAX_INTERVAL', 900)
+        self.key = f"{self.key_prefix}{topic}"
+        self.seen_fingerprints = []
+
+    def load(self):
+        return self.cache.get(self.key) or {
+            'interval': self.min_interval,
+            'next_run_at': 0.0,
+            'fingerprints': [],
+        }
+
+    def save(self, state):
+        self.cache.set(self.key, state, None)
+
+    @staticmethod
+    def fingerprint(urls):
+        return hashlib.sha1('\n'.join(urls).encode('utf-8')).hexdigest()
+
+    def claim_due_run(self):
+        """
+        Check whether the topic is due and push its next run one interval ahead
+
+        Returns:
+            True when a run should be dispatched now
+        """
+        state = self.load()
+        now = time.time()
+        if now < state['next_run_at']:
+            return False
+        state['next_run_at'] = now + state['interval']
+        self.save(state)
+        return True
+
+    def page_filter(self, url_filter=None):
+        """
+        Wrap a crawl url_filter so pages unchanged since the last run yield no URLs
+
+        Args:
+            url_filter: Filter applied to the URLs of changed pages
+
+        Returns:
+            Callable for discover_article_urls(url_filter=...)
+        """
+        previous = set(self.load()['fingerprints'])
+
+        def filter_page(urls):
+            fingerprint = self.fingerprint(urls)
+            self.seen_fingerprints.append(fingerprint)
+            if fingerprint in previous:
+                logger.info(f"Listing page unchanged for {self.topic}, skipping its articles")
+                return []
+            return url_filter(urls) if url_filter else urls
+
+        return filter_page
+
+    def record_run(self, new_count, complete=True):
+        """
+        Adapt the polling interval to the outcome of a run
+
+        The fingerprints of the run's listing pages are only saved when every
+        article it set out to fetch was persisted. Otherwise the pages are
+        looked at again next run, and the failed articles, which never enter
+        the known-URL index, are retried.
+
+        Args:
+            new_count: Number of new articles the run found
+            complete: False when some article fetches, parses or writes failed
+
+        Returns:
+            The new polling interval in seconds
+        """
+        state = self.load()
+        factor = self.speedup if new_count else self.slowdown
+        interval = min(self.max_interval, max(self.min_interval, state['interval'] * factor))
+        state.update(interval=interval, next_run_at=time.time() + interval)
+        if self.seen_fingerprints and complete:
+            state['fingerprints'] = self.seen_fingerprints
+        self.save(state)
+        logger.info(f"{self.topic}: {new_count} new articles, polling every {interval:.0f}s")
+        return interval
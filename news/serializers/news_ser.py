@@ -3,7 +3,39 @@ from news.models.news_model import News
 
 
 class NewsSerializer(serializers.ModelSerializer):
+    # Only present on full-text search results
+    rank = serializers.FloatField(read_only=True)
+    headline = serializers.CharField(read_only=True)
+
     class Meta:
         model = News
-        fields = '__all__'
+        exclude = ('search_vector',)
         read_only_fields = ('created_at', 'updated_at', 'id')
+
+
+class NewsTagNamesSerializer(NewsSerializer):
+    """
+    NewsSerializer rendering tags by name instead of by id
+    """
+    tags = serializers.SlugRelatedField(slug_field='name', many=True, read_only=True)
+
+
+class NewsListSerializer(serializers.ModelSerializer):
+    """
+    Compact news representation for lists: the stored excerpt instead of the full text
+    """
+    # Only present on full-text search results
+    rank = serializers.FloatField(read_only=True)
+    headline = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = News
+        exclude = ('text', 'search_vector')
+        read_only_fields = ('created_at', 'updated_at', 'id')
+
+
+class NewsListTagNamesSerializer(NewsListSerializer):
+    """
+    NewsListSerializer rendering tags by name instead of by id
+    """
+    tags = serializers.SlugRelatedField(slug_field='name', many=True, read_only=True)
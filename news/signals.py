@@ -0,0 +1,20 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from news.models.news_model import News
+from news.models.tag_model import Tag
+from utility.counts import invalidate_counts
+
+
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_news_counts(sender, using=None, **kwargs):
+    # Tags are filtered on too, so tag changes also change news counts
+    invalidate_counts(News, using=using)
+
+
+@receiver(m2m_changed, sender=News.tags.through)
+def invalidate_news_counts_on_tagging(sender, action, using=None, **kwargs):
+    if action.startswith('post_'):
+        invalidate_counts(News, using=using)
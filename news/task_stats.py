@@ -0,0 +1,31 @@
+from django.core.cache import cache
+
+STATS_KEY_PREFIX = 'scrape:task-stats:'
+STAT_NAMES = ('runs', 'skipped')
+
+
+def increment(name, topic):
+    """
+    Increment a scrape task counter shared by all workers
+
+    Args:
+        name: Counter name, one of STAT_NAMES
+        topic: Topic the task scraped
+
+    Returns:
+        The new counter value
+    """
+    key = f"{STATS_KEY_PREFIX}{topic}:{name}"
+    cache.add(key, 0, None)
+    return cache.incr(key)
+
+
+def get_stats(topic):
+    """
+    Report the scrape task counters of a topic
+
+    Returns:
+        Dictionary of counter name -> value
+    """
+    values = cache.get_many([f"{STATS_KEY_PREFIX}{topic}:{name}" for name in STAT_NAMES])
+    return {name: values.get(f"{STATS_KEY_PREFIX}{topic}:{name}", 0) for name in STAT_NAMES}
@@ -1,24 +1,230 @@
-from celery import shared_task
-from news.views.scrap_news_view import ScrapedNewsView
+import threading
+from celery import shared_task, chord, group
+from django.conf import settings
+from news import scrape_jobs, task_stats
+from news.ingest import ingest_articles
+from news.known_urls import KnownUrlIndex
+from news.scrape_schedule import AdaptiveSchedule
+from utility.locks import CacheLock
+from utility.pipeline import StreamingPipeline
+from utility.scrape_cache import ScrapeCache
+from utility.scraped_article import ScrapedArticle
+from utility.scraper import (
+    scrape_digiato_news, discover_article_urls, fetch_article_html, parse_article_html
+)
 
 
 @shared_task
-def scrape_news_task():
+def schedule_scrape_news_task():
+    """
+    Beat entry point: dispatch a scrape for every topic that is due
+
+    SCRAPER_PIPELINE selects the scrape: the Celery canvas of discover_news_task
+    by default, or scrape_news_task and its StreamingPipeline in one worker.
+    """
+    dispatched = []
+    use_canvas = getattr(settings, 'SCRAPER_PIPELINE', 'canvas') == 'canvas'
+    for topic in getattr(settings, 'SCRAPER_TOPICS', ['tech']):
+        if AdaptiveSchedule(topic).claim_due_run():
+            if use_canvas:
+                discover_news_task.delay(topic=topic)
+            else:
+                scrape_news_task.delay(topic=topic)
+            dispatched.append(topic)
+    return f"Dispatched: {', '.join(dispatched) or 'none'}"
+
+
+@shared_task
+def scrape_news_task(page_number=1, topic='tech', incremental=None):
+    # A run can outlast the polling interval: hold a lease so runs never overlap
+    lease = getattr(settings, 'SCRAPER_TASK_LEASE', 60)
+    lock = CacheLock(f"scrape-news-task:{topic}", timeout=lease, heartbeat_interval=lease / 3)
+    if not lock.acquire():
+        skipped = task_stats.increment('skipped', topic)
+        print(f"Skipping news scraping task, a previous run is still in progress ({skipped} runs skipped)")
+        return f"Skipped: previous run still in progress ({skipped} runs skipped)"
+
+    try:
+        task_stats.increment('runs', topic)
+        return run_scrape_news(page_number, topic, incremental)
+    finally:
+        lock.release()
+
+
+def run_scrape_news(page_number, topic, incremental):
     try:
         print("Starting news scraping task!")
 
-        view = ScrapedNewsView()
+        if incremental is None:
+            incremental = getattr(settings, 'SCRAPER_INCREMENTAL', True)
+
+        if incremental:
+            known_urls = KnownUrlIndex()
+            schedule = AdaptiveSchedule(topic)
+            urls = discover_article_urls(topic=topic, url_filter=schedule.page_filter(known_urls.unknown))
 
-        if hasattr(view, 'scrape_news') and callable(view.scrape_news):
-            results = view.scrape_news()
-            print(f"News scraped successfully! Found {len(results)} articles")
-            return f"Success: {len(results)} articles scraped"
+            # Articles are written batch by batch as they are parsed
+            def persist(batch):
+                batch_stats = ingest_articles(batch)
+                known_urls.add(item.source for item in batch)
+                return batch_stats
 
-        print("News scraped successfully!")
-        return "Success"
+            stats = StreamingPipeline(persist).run(urls)
+            scraped = stats['extracted']
+            schedule.record_run(scraped, complete=not stats['failed'])
+        else:
+            news_items = scrape_digiato_news(page_number=page_number, topic=topic)
+            stats = ingest_articles(news_items)
+            scraped = len(news_items)
+
+        print(f"News scraped successfully! Found {scraped} articles, saved {stats['saved']}")
+        return f"Success: {scraped} articles scraped, {stats['saved']} saved, {stats['unchanged']} unchanged"
 
     except Exception as e:
         print(f"Exception occurred during news scraping: {str(e)}")
         import traceback
         traceback.print_exc()
         return f"Exception: {str(e)}"
+
+
+def canvas_lease(topic, token=None):
+    """
+    Topic lease of a scrape canvas, renewed by each stage that works on it
+    """
+    lease = getattr(settings, 'SCRAPER_CANVAS_LEASE', 300)
+    return CacheLock(f"scrape-news-task:{topic}", timeout=lease, heartbeat_interval=lease / 3, token=token)
+
+
+def renew_canvas_lease(topic, lease_token):
+    if lease_token:
+        canvas_lease(topic, lease_token).extend()
+
+
+@shared_task
+def discover_news_task(topic='tech'):
+    """
+    First stage of the scrape canvas: find the new article URLs of a topic
+
+    Fans out one fetch -> parse chain per article and joins them in a chord
+    whose callback persists the batch. The topic lease is handed over to the
+    stages: every fetch and parse task renews it, the callback keeps it alive
+    while persisting and releases it once the batch is stored. A canvas that
+    stalls or loses its workers frees the topic one lease after its last task.
+    """
+    lock = canvas_lease(topic)
+    if not lock.acquire():
+        skipped = task_stats.increment('skipped', topic)
+        return f"Skipped: previous run still in progress ({skipped} runs skipped)"
+
+    try:
+        task_stats.increment('runs', topic)
+        schedule = AdaptiveSchedule(topic)
+        urls = discover_article_urls(topic=topic, url_filter=schedule.page_filter(KnownUrlIndex().unknown))
+
+        if not urls:
+            schedule.record_run(0)
+            lock.release()
+            return "Success: 0 new articles"
+
+        # The stages renew the lease from here on
+        lock.stop_heartbeat()
+        header = group(
+            fetch_article_task.s(url, topic=topic, lease_token=lock.token) |
+            parse_article_task.s(topic=topic, lease_token=lock.token)
+            for url in urls
+        )
+        chord(header)(persist_articles_task.s(topic, schedule.seen_fingerprints, lock.token))
+        return f"Dispatched: {len(urls)} articles"
+
+    except Exception as e:
+        lock.release()
+        return f"Exception: {str(e)}"
+
+
+@shared_task
+def fetch_article_task(url, topic='tech', lease_token=None):
+    """
+    IO stage: download one article page
+
+    Returns:
+        Dictionary with the URL and its HTML, or None on failure
+    """
+    renew_canvas_lease(topic, lease_token)
+    html_content = fetch_article_html(url)
+    if html_content is None:
+        return None
+    return {'url': url, 'html': html_content}
+
+
+@shared_task
+def parse_article_task(fetched, topic='tech', lease_token=None):
+    """
+    CPU stage: extract the article data from a downloaded page
+
+    Returns:
+        Article dictionary (ScrapedArticle.as_dict), or None when the fetch or the parse failed
+    """
+    renew_canvas_lease(topic, lease_token)
+    if not fetched:
+        return None
+    try:
+        news_item = parse_article_html(fetched['html'], fetched['url'])
+        return news_item.as_dict() if news_item else None
+    except Exception as e:
+        print(f"Error parsing article {fetched['url']}: {str(e)}")
+        return None
+
+
+@shared_task
+def persist_articles_task(news_items, topic='tech', fingerprints=None, lease_token=None):
+    """
+    Chord callback: bulk-persist the parsed articles of a scrape run
+
+    Failed articles arrive as None and are dropped, so one bad article never
+    fails the batch.
+    """
+    lock = canvas_lease(topic, lease_token) if lease_token else None
+    if lock is not None:
+        lock.start_heartbeat()
+    try:
+        complete = all(news_items)
+        news_items = [ScrapedArticle.from_dict(item) for item in news_items if item]
+        stats = ingest_articles(news_items)
+        KnownUrlIndex().add(item.source for item in news_items)
+
+        schedule = AdaptiveSchedule(topic)
+        schedule.seen_fingerprints = fingerprints or []
+        schedule.record_run(len(news_items), complete=complete)
+
+        return f"Success: {len(news_items)} articles scraped, {stats['saved']} saved, {stats['unchanged']} unchanged"
+
+    finally:
+        if lock is not None:
+            lock.release()
+
+
+@shared_task
+def scrape_job_task(job_id):
+    job = scrape_jobs.update_job(job_id, status=scrape_jobs.RUNNING)
+    if job is None:
+        return f"Expired: {job_id}"
+
+    progress_lock = threading.Lock()
+
+    def report_progress(completed, total):
+        with progress_lock:
+            scrape_jobs.update_job(job_id, progress={'completed': completed, 'total': total})
+
+    try:
+        news_items = scrape_digiato_news(page_number=job['page'], topic=job['topic'],
+                                         progress_callback=report_progress)
+        ScrapeCache().set(job['page'], job['topic'], news_items)
+
+        with progress_lock:
+            scrape_jobs.update_job(job_id, status=scrape_jobs.DONE, items=news_items,
+                                   progress={'completed': len(news_items), 'total': len(news_items)})
+        return f"Success: {len(news_items)} articles scraped"
+
+    except Exception as e:
+        scrape_jobs.update_job(job_id, status=scrape_jobs.FAILED, error=str(e))
+        return f"Exception: {str(e)}"
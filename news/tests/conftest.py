@@ -1,7 +1,10 @@
 import pytest
+from django.core.cache import cache
 from pytest_factoryboy import register
 from .factory import NewsFactory, TagFactory
 from rest_framework.test import APIClient
+from TechNews.celery import app as celery_app
+from utility.tests.stand_in_site import StandInSite
 
 register(NewsFactory)
 register(TagFactory)
@@ -10,3 +13,18 @@ register(TagFactory)
 @pytest.fixture
 def api_client():
     return APIClient
+
+
+@pytest.fixture
+def stand_in_site(settings):
+    cache.clear()
+    with StandInSite(articles_per_page=5, pages=2) as site:
+        settings.SCRAPER_BASE_URL = site.base_url
+        yield site
+
+
+@pytest.fixture
+def eager_celery():
+    celery_app.conf.task_always_eager = True
+    yield
+    celery_app.conf.task_always_eager = False
@@ -22,7 +22,7 @@ class NewsFactory(DjangoModelFactory):
     id = factory.LazyFunction(uuid.uuid4)
     title = factory.Faker('sentence', nb_words=6)
     text = factory.Faker('paragraph', nb_sentences=5)
-    source = factory.Faker('company')
+    source = factory.Sequence(lambda n: f'https://digiato.com/news-{n}')
     created_at = factory.LazyFunction(datetime.now)
 
     @factory.post_generation
@@ -0,0 +1,74 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from news.ingest import ingest_articles
+from utility.scraped_article import compute_content_hash
+from news.models.news_model import News
+from news.models.tag_model import Tag
+from utility.scraped_article import ScrapedArticle
+
+pytestmark = pytest.mark.django_db
+
+
+def make_items(count, prefix='خبر'):
+    return [
+        ScrapedArticle(
+            title=f'{prefix} {i}',
+            text=f'متن کامل {prefix} {i}',
+            source=f'https://digiato.com/article-{i}',
+            tags=['فناوری', f'tag-{i % 3}'],
+        )
+        for i in range(count)
+    ]
+
+
+class TestIngestArticles:
+
+    def test_creates_news_with_tags(self):
+        # act
+        stats = ingest_articles(make_items(5))
+
+        # assert
+        assert stats == {'saved': 5, 'unchanged': 0}
+        assert News.objects.count() == 5
+        assert Tag.objects.count() == 4
+        news = News.objects.get(source='https://digiato.com/article-1')
+        assert news.content_hash == compute_content_hash(news.title, news.text)
+        assert news.excerpt == news.text
+        assert set(news.tags.values_list('name', flat=True)) == {'فناوری', 'tag-1'}
+
+    def test_unchanged_articles_are_skipped(self):
+        # arrange
+        ingest_articles(make_items(5))
+
+        # act
+        stats = ingest_articles(make_items(5))
+
+        # assert
+        assert stats == {'saved': 0, 'unchanged': 5}
+        assert News.objects.count() == 5
+
+    def test_changed_articles_are_updated_in_place(self):
+        # arrange
+        ingest_articles(make_items(3))
+        created_ids = set(News.objects.values_list('id', flat=True))
+
+        # act
+        stats = ingest_articles(make_items(3, prefix='به‌روز'))
+
+        # assert
+        assert stats == {'saved': 3, 'unchanged': 0}
+        assert set(News.objects.values_list('id', flat=True)) == created_ids
+        assert News.objects.get(source='https://digiato.com/article-0').title == 'به‌روز 0'
+
+    def test_query_count_does_not_grow_with_batch(self):
+        # act
+        with CaptureQueriesContext(connection) as small_batch:
+            ingest_articles(make_items(5))
+        News.objects.all().delete()
+        with CaptureQueriesContext(connection) as large_batch:
+            ingest_articles(make_items(100))
+
+        # assert
+        assert News.objects.count() == 100
+        assert len(large_batch.captured_queries) == len(small_batch.captured_queries)
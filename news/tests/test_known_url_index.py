@@ -0,0 +1,32 @@
+import pytest
+from django.core.cache import cache
+from news.known_urls import KnownUrlIndex
+
+pytestmark = pytest.mark.django_db
+
+
+class TestKnownUrlIndex:
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_index_is_warmed_from_stored_news(self, news_factory):
+        # arrange
+        news = news_factory(source='https://digiato.com/known')
+
+        # act
+        unknown = KnownUrlIndex().unknown([news.source, 'https://digiato.com/new'])
+
+        # assert
+        assert unknown == ['https://digiato.com/new']
+
+    def test_added_urls_become_known(self):
+        # arrange
+        index = KnownUrlIndex()
+        urls = ['https://digiato.com/a', 'https://digiato.com/b']
+
+        # act
+        index.add(urls[:1])
+
+        # assert
+        assert index.unknown(urls) == ['https://digiato.com/b']
@@ -0,0 +1,123 @@
+import pytest
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from news.ingest import ingest_articles
+from news.models.news_model import News
+from utility.counts import CountStrategy
+from utility.pagination import CountedPaginator
+from utility.scraped_article import ScrapedArticle
+
+pytestmark = pytest.mark.django_db
+
+
+def count_queries(queries):
+    return [query['sql'] for query in queries.captured_queries if 'COUNT(' in query['sql']]
+
+
+class TestNewsListCounts:
+    endpoint = reverse('news:news-list')
+
+    def test_exact_count_is_cached_per_filter_signature(self, news_factory, api_client):
+        # arrange
+        cache.clear()
+        news_factory(title='Python News', text='Python is awesome')
+        news_factory(title='Rust News', text='Rust is fast')
+        client = api_client()
+        first = client.get(f"{self.endpoint}?keywords=python,rust&keyword=is")
+
+        # act
+        with CaptureQueriesContext(connection) as queries:
+            second = client.get(f"{self.endpoint}?keyword=is&keywords=python, rust&page_size=5")
+
+        # assert
+        assert first.data['count'] == second.data['count'] == 2
+        assert second.data['count_estimated'] is False
+        assert count_queries(queries) == []
+
+    def test_writes_invalidate_cached_counts(self, news_factory, api_client):
+        # arrange
+        cache.clear()
+        news_factory.create_batch(2)
+        client = api_client()
+        assert client.get(self.endpoint).data['count'] == 2
+
+        # act
+        news_factory()
+        after_save = client.get(self.endpoint).data['count']
+        News.objects.first().delete()
+        after_delete = client.get(self.endpoint).data['count']
+        ingest_articles([ScrapedArticle(title='خبر', text='متن', source='https://digiato.com/a')])
+        after_ingest = client.get(self.endpoint).data['count']
+
+        # assert
+        assert (after_save, after_delete, after_ingest) == (3, 2, 3)
+
+    def test_large_results_use_the_planner_estimate(self, news_factory, api_client):
+        # arrange
+        cache.clear()
+        news_factory.create_batch(3)
+
+        # act
+        with mock.patch.object(CountStrategy, 'estimate', return_value=50000), \
+                CaptureQueriesContext(connection) as queries:
+            first_page = api_client().get(f"{self.endpoint}?page_size=2")
+            last_page = api_client().get(f"{self.endpoint}?page_size=2&page=2")
+
+        # assert
+        assert first_page.data['count'] == 50000
+        assert first_page.data['count_estimated'] is True
+        assert first_page.data['next'] is not None
+        assert len(last_page.data['results']) == 1
+        assert last_page.data['next'] is None
+        assert count_queries(queries) == []
+
+    def test_estimated_page_past_the_end_is_not_found(self, news_factory, api_client):
+        # arrange
+        news_factory.create_batch(3)
+
+        # act
+        with mock.patch.object(CountStrategy, 'estimate', return_value=50000):
+            response = api_client().get(f"{self.endpoint}?page_size=2&page=5")
+
+        # assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestCountedPaginator:
+
+    def test_pages_past_an_underestimated_count_link_back(self):
+        # arrange
+        count_strategy = mock.Mock(spec=CountStrategy)
+        count_strategy.count.return_value = (15, True)
+        paginator = CountedPaginator(list(range(100)), 10, count_strategy=count_strategy)
+
+        # act
+        page = paginator.page(5)
+
+        # assert
+        assert list(page) == list(range(40, 50))
+        assert page.has_previous()
+        assert page.previous_page_number() == 4
+        assert page.next_page_number() == 6
+
+
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='Planner estimates need Postgres')
+class TestCountEstimates:
+
+    def test_estimates_come_from_the_planner(self, news_factory):
+        # arrange
+        news_factory.create_batch(20)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE news_news')
+
+        # act
+        table_estimate = CountStrategy().estimate(News.objects.all())
+        filtered_estimate = CountStrategy().estimate(News.objects.filter(title__icontains='x'))
+
+        # assert
+        assert table_estimate == 20
+        assert filtered_estimate is not None
@@ -0,0 +1,51 @@
+import uuid
+import pytest
+from rest_framework import status
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+class TestNewsDetailEndpoint:
+    def get_endpoint(self, news_id):
+        return reverse('news:news-detail', kwargs={'news_id': news_id})
+
+    def test_news_detail_returns_full_text(self, news_factory, tag_factory, api_client):
+        # arrange
+        news = news_factory(text='Python is awesome ' * 50)
+        news.tags.add(tag_factory(name='technology'))
+
+        # act
+        response = api_client().get(self.get_endpoint(news.id))
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['text'] == news.text
+        assert response.data['excerpt'] == news.excerpt
+        assert 'search_vector' not in response.data
+
+    def test_news_detail_renders_tag_names(self, news_factory, tag_factory, api_client):
+        # arrange
+        news = news_factory()
+        news.tags.add(tag_factory(name='technology'))
+
+        # act
+        response = api_client().get(f"{self.get_endpoint(news.id)}?tag_names=true")
+
+        # assert
+        assert 'technology' in response.data['tags']
+        assert sorted(response.data['tags']) == sorted(news.tags.values_list('name', flat=True))
+
+    def test_news_detail_not_found(self, api_client):
+        # act
+        response = api_client().get(self.get_endpoint(uuid.uuid4()))
+
+        # assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_news_detail_with_malformed_id_not_found(self, api_client):
+        # act
+        response = api_client().get('/api/v1/news/not-a-uuid/')
+
+        # assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
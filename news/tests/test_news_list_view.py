@@ -1,6 +1,20 @@
+from base64 import b64encode
+
 import pytest
+from django.core.cache import cache
+from django.db import connection
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from news.filters import NewsFilter
+from news.ingest import ingest_articles
+from news.models.news_model import News
+from news.views.news_list_view import NewsListView
+from utility.scraped_article import ScrapedArticle
 
 
 pytestmark = pytest.mark.django_db
@@ -77,3 +91,232 @@ class TestNewsEndpoint:
         assert response.status_code == status.HTTP_200_OK
         created_dates = [item['created_at'] for item in response.data['results']]
         assert created_dates == sorted(created_dates, reverse=True)
+
+    def test_exclude_keywords_is_one_predicate(self, news_factory, api_client):
+        # arrange
+        news_factory(title='Python News', text='Python is awesome')
+        news_factory(title='Java News', text='Java is great')
+        news_factory(title='Rust News', text='Rust is fast')
+        queryset = NewsFilter(QueryDict('exclude_keywords=python, JAVA'), queryset=News.objects.all()).qs
+
+        # act
+        response = api_client().get(f"{self.endpoint}?exclude_keywords=python, JAVA")
+
+        # assert
+        assert [item['title'] for item in response.data['results']] == ['Rust News']
+        assert str(queryset.query).count('NOT') == 1
+
+    def test_keywords_match_title_or_text(self, news_factory, api_client):
+        # arrange
+        news_factory(title='Python News', text='Some content')
+        news_factory(title='Other News', text='About RUST')
+        news_factory(title='Java News', text='Java is great')
+
+        # act
+        response = api_client().get(f"{self.endpoint}?keywords=python,rust")
+
+        # assert
+        assert response.data['count'] == 2
+
+    def test_cursor_pagination_walks_every_news_once(self, news_factory, api_client):
+        # arrange
+        news_factory.create_batch(7)
+        client = api_client()
+
+        # act
+        titles = []
+        url = f"{self.endpoint}?pagination=cursor&page_size=3"
+        while url:
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert 'count' not in response.data
+            titles.extend(item['title'] for item in response.data['results'])
+            url = response.data['next']
+
+        # assert
+        expected = list(News.objects.order_by('-created_at', '-id').values_list('title', flat=True))
+        assert titles == expected
+
+    def test_cursor_pagination_orders_ties_on_id(self, news_factory, api_client):
+        # arrange
+        news_factory.create_batch(7)
+        News.objects.update(created_at=timezone.now())
+        client = api_client()
+        expected = list(News.objects.order_by('-created_at', '-id').values_list('title', flat=True))
+
+        # act
+        pages = []
+        url = f"{self.endpoint}?pagination=cursor&page_size=3"
+        while url:
+            response = client.get(url)
+            pages.append([item['title'] for item in response.data['results']])
+            previous_url = response.data['previous']
+            url = response.data['next']
+        previous_page = [item['title'] for item in client.get(previous_url).data['results']]
+
+        # assert
+        assert [title for page in pages for title in page] == expected
+        assert previous_page == pages[-2]
+
+    def test_cursor_pagination_rejects_a_malformed_cursor(self, api_client):
+        # arrange
+        cursor = b64encode(b'p=not-a-date|not-a-uuid').decode('ascii')
+
+        # act
+        response = api_client().get(f"{self.endpoint}?pagination=cursor&cursor={cursor}")
+
+        # assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_cursor_pagination_skips_count_and_offset(self, news_factory, api_client):
+        # arrange
+        news_factory.create_batch(5)
+        client = api_client()
+        next_url = client.get(f"{self.endpoint}?pagination=cursor&page_size=2").data['next']
+
+        # act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(next_url)
+
+        # assert
+        assert len(response.data['results']) == 2
+        news_queries = [query['sql'] for query in queries.captured_queries if 'news_news' in query['sql']]
+        assert not any('COUNT(' in sql or 'OFFSET' in sql for sql in news_queries)
+
+    @pytest.mark.parametrize('tag_names', ['false', 'true'])
+    def test_query_count_does_not_grow_with_page_size(self, news_factory, api_client, tag_names):
+        # arrange
+        news_factory.create_batch(100)
+        client = api_client()
+
+        # act
+        query_counts = []
+        for page_size in (10, 100):
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(f"{self.endpoint}?page_size={page_size}&tag_names={tag_names}")
+            assert len(response.data['results']) == page_size
+            query_counts.append(len(queries.captured_queries))
+
+        # assert
+        assert query_counts[0] == query_counts[1]
+
+    def test_tag_names_are_rendered_on_request(self, news_factory, tag_factory, api_client):
+        # arrange
+        news = news_factory()
+        news.tags.add(tag_factory(name='technology'))
+
+        # act
+        response = api_client().get(f"{self.endpoint}?tag_names=true")
+
+        # assert
+        assert 'technology' in response.data['results'][0]['tags']
+        assert sorted(response.data['results'][0]['tags']) == sorted(news.tags.values_list('name', flat=True))
+
+    def test_search_fields_are_only_returned_for_search(self, news_factory, api_client):
+        # arrange
+        news_factory(title='Python News')
+
+        # act
+        response = api_client().get(self.endpoint)
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        result = response.data['results'][0]
+        assert 'search_vector' not in result
+        assert 'rank' not in result and 'headline' not in result
+
+    def test_list_serves_excerpts_without_reading_text(self, news_factory, api_client):
+        # arrange
+        news = news_factory(text='Python is awesome ' * 50)
+
+        view = NewsListView(request=Request(APIRequestFactory().get(self.endpoint)))
+
+        # act
+        response = api_client().get(self.endpoint)
+        listed_news = view.get_queryset().get()
+
+        # assert
+        result = response.data['results'][0]
+        assert 'text' not in result
+        assert result['excerpt'] == news.excerpt
+        assert len(result['excerpt']) < len(news.text)
+        assert 'text' in listed_news.get_deferred_fields()
+
+    @pytest.mark.parametrize('tag_names', ['false', 'true'])
+    def test_full_text_is_returned_on_request(self, news_factory, api_client, tag_names):
+        # arrange
+        news = news_factory(text='Python is awesome ' * 50)
+
+        # act
+        response = api_client().get(f"{self.endpoint}?full_text=true&tag_names={tag_names}")
+
+        # assert
+        assert response.data['results'][0]['text'] == news.text
+
+
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='Full-text search needs Postgres')
+class TestNewsFullTextSearch:
+    endpoint = reverse('news:news-list')
+
+    def test_results_are_ranked_with_headlines(self, news_factory, api_client):
+        # arrange
+        news_factory(title='Chip news', text='A new GPU was announced.')
+        news_factory(title='GPU prices', text='GPU supply grows and GPU prices fall.')
+        news_factory(title='Battery news', text='Solid state batteries.')
+
+        # act
+        response = api_client().get(f"{self.endpoint}?search=gpu")
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 2
+        first, second = response.data['results']
+        assert first['title'] == 'GPU prices'
+        assert first['rank'] > second['rank']
+        assert '<mark>GPU</mark>' in first['headline']
+
+    def test_web_search_syntax(self, news_factory, api_client):
+        # arrange
+        news_factory(title='Apple chip', text='The new chip is fast.')
+        news_factory(title='Intel chip', text='Another chip.')
+
+        # act
+        response = api_client().get(f"{self.endpoint}?search=chip -apple")
+
+        # assert
+        assert [item['title'] for item in response.data['results']] == ['Intel chip']
+
+    def test_vector_is_maintained_by_bulk_ingest(self, api_client):
+        # arrange
+        article = ScrapedArticle(title='هوش مصنوعی', text='مدل زبانی', source='https://digiato.com/a')
+        ingest_articles([article])
+        updated = ScrapedArticle(title='هوش مصنوعی', text='تراشه جدید', source='https://digiato.com/a')
+
+        # act
+        ingest_articles([updated])
+
+        # assert
+        assert api_client().get(f"{self.endpoint}?search=تراشه").data['count'] == 1
+        assert api_client().get(f"{self.endpoint}?search=مدل").data['count'] == 0
+
+
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='Trigram indexes need Postgres')
+class TestNewsTrigramIndexes:
+
+    @pytest.mark.parametrize('params, index', [
+        ('keyword=python', 'news_text_upper_trgm'),
+        ('keywords=python,rust', 'news_title_upper_trgm'),
+    ])
+    def test_keyword_filters_use_trigram_indexes(self, news_factory, params, index):
+        # arrange
+        news_factory.create_batch(5)
+        queryset = NewsFilter(QueryDict(params), queryset=News.objects.all()).qs
+
+        # act
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+
+        # assert
+        assert index in plan
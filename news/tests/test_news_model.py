@@ -1,4 +1,5 @@
 import pytest
+from news.models.news_model import EXCERPT_LENGTH, make_excerpt
 
 pytestmark = pytest.mark.django_db
 
@@ -9,3 +10,17 @@ class TestNewsModel:
         news = news_factory()
 
         assert news.__str__() == news.title
+
+    def test_excerpt_is_kept_in_sync_with_text(self, news_factory):
+        # arrange
+        news = news_factory(text='short  body\nof text')
+
+        # act
+        news.text = 'word ' * 100
+        news.save(update_fields=['text'])
+        news.refresh_from_db()
+
+        # assert
+        assert len(news.excerpt) <= EXCERPT_LENGTH
+        assert news.excerpt.endswith('word…')
+        assert make_excerpt('short  body\nof text') == 'short body of text'
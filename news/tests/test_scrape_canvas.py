@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from news import task_stats
+from news.models.news_model import News
+from news.tasks import (
+    canvas_lease, discover_news_task, fetch_article_task, parse_article_task, persist_articles_task
+)
+from utility.locks import CacheLock
+
+pytestmark = pytest.mark.django_db
+
+
+class TestScrapeCanvas:
+
+    def test_canvas_persists_new_articles(self, stand_in_site, eager_celery):
+        # act
+        result = discover_news_task()
+
+        # assert
+        assert result == 'Dispatched: 10 articles'
+        assert News.objects.count() == 10
+        assert not CacheLock('scrape-news-task:tech').is_locked()
+
+    def test_failed_article_does_not_fail_the_batch(self, stand_in_site, eager_celery):
+        # arrange
+        stand_in_site.inject_faults('/article-1-2', [404])
+
+        # act
+        discover_news_task()
+
+        # assert
+        assert News.objects.count() == 9
+        assert not News.objects.filter(source=stand_in_site.article_url(1, 2)).exists()
+
+    def test_failed_article_is_retried_on_the_next_run(self, stand_in_site, eager_celery):
+        # arrange
+        stand_in_site.inject_faults('/article-1-2', [404])
+        discover_news_task()
+        stand_in_site.hits.clear()
+
+        # act
+        result = discover_news_task()
+
+        # assert
+        assert result == 'Dispatched: 1 articles'
+        assert News.objects.filter(source=stand_in_site.article_url(1, 2)).exists()
+
+    def test_nothing_is_dispatched_for_known_articles(self, stand_in_site, eager_celery):
+        # arrange
+        discover_news_task()
+        stand_in_site.hits.clear()
+
+        # act
+        result = discover_news_task()
+
+        # assert
+        assert result == 'Success: 0 new articles'
+        assert stand_in_site.article_hits() == {}
+
+    def test_overlapping_run_is_skipped(self, stand_in_site, eager_celery):
+        # arrange
+        CacheLock('scrape-news-task:tech').acquire()
+
+        # act
+        result = discover_news_task()
+
+        # assert
+        assert result.startswith('Skipped')
+        assert task_stats.get_stats('tech')['skipped'] == 1
+
+    def test_parse_and_persist_stages_tolerate_failed_articles(self):
+        # act
+        parsed = parse_article_task({'url': 'https://digiato.com/empty', 'html': '<html></html>'})
+        result = persist_articles_task([None, parsed], 'tech')
+
+        # assert
+        assert parsed is None
+        assert result.startswith('Success: 0 articles')
+
+    def test_stages_renew_the_canvas_lease(self, stand_in_site, settings):
+        # arrange
+        settings.SCRAPER_CANVAS_LEASE = 1
+        lock = canvas_lease('tech')
+        lock.acquire()
+        lock.stop_heartbeat()
+
+        # act
+        time.sleep(0.6)
+        fetched = fetch_article_task(stand_in_site.article_url(1, 1), topic='tech', lease_token=lock.token)
+        time.sleep(0.6)
+        parse_article_task(fetched, topic='tech', lease_token=lock.token)
+        time.sleep(0.6)
+
+        # assert
+        assert lock.is_locked()
+        persist_articles_task([], 'tech', lease_token=lock.token)
+        assert not lock.is_locked()
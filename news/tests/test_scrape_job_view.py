@@ -0,0 +1,46 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from news import scrape_jobs
+from news.tasks import scrape_job_task
+
+pytestmark = pytest.mark.django_db
+
+
+class TestScrapeJobEndpoint:
+    endpoint = reverse('news:news-scrape-job-create')
+
+    def test_job_is_accepted_with_job_id(self, api_client, monkeypatch):
+        # arrange
+        enqueued = []
+        monkeypatch.setattr(scrape_job_task, 'delay', enqueued.append)
+
+        # act
+        response = api_client().post(self.endpoint, {'page': 1, 'topic': 'tech'})
+
+        # assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert enqueued == [response.data['job_id']]
+        assert response.data['status'] == scrape_jobs.PENDING
+        assert response.data['status_url'].endswith(f"/scrape/jobs/{response.data['job_id']}/")
+
+    def test_finished_job_returns_paginated_results(self, stand_in_site, api_client, eager_celery):
+        # arrange
+        job_id = api_client().post(self.endpoint, {'page': 1}).data['job_id']
+
+        # act
+        response = api_client().get(reverse('news:news-scrape-job', args=[job_id]), {'page_size': 2})
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['status'] == scrape_jobs.DONE
+        assert response.data['progress'] == {'completed': 5, 'total': 5}
+        assert response.data['count'] == 5
+        assert len(response.data['results']) == 2
+
+    def test_unknown_job_returns_404(self, api_client):
+        # act
+        response = api_client().get(reverse('news:news-scrape-job', args=['missing']))
+
+        # assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+from news import task_stats
+from news.models.news_model import News
+from news.tasks import scrape_news_task
+from utility.locks import CacheLock
+
+pytestmark = pytest.mark.django_db
+
+
+class TestScrapeNewsTask:
+
+    def test_task_persists_scraped_news(self, stand_in_site):
+        # act
+        result = scrape_news_task()
+
+        # assert
+        assert result.startswith('Success')
+        assert News.objects.count() == 10
+        assert News.objects.filter(tags__name='فناوری').count() == 10
+
+    def test_incremental_run_does_not_refetch_known_articles(self, stand_in_site):
+        # arrange
+        scrape_news_task()
+        stand_in_site.hits.clear()
+
+        # act
+        scrape_news_task()
+
+        # assert
+        assert stand_in_site.article_hits() == {}
+        assert stand_in_site.hits['/topic/tech/page/1'] == 1
+        assert stand_in_site.hits['/topic/tech/page/2'] == 0
+
+    def test_overlapping_run_is_skipped(self, stand_in_site):
+        # arrange
+        running = CacheLock('scrape-news-task:tech', timeout=60)
+        running.acquire()
+
+        # act
+        result = scrape_news_task()
+
+        # assert
+        assert result.startswith('Skipped')
+        assert stand_in_site.hits == {}
+        assert task_stats.get_stats('tech') == {'runs': 0, 'skipped': 1}
+
+    def test_expired_lease_of_crashed_run_is_recovered(self, stand_in_site):
+        # arrange
+        crashed = CacheLock('scrape-news-task:tech', timeout=1)
+        crashed.acquire()
+        time.sleep(1.1)
+
+        # act
+        result = scrape_news_task()
+
+        # assert
+        assert result.startswith('Success')
+        assert task_stats.get_stats('tech') == {'runs': 1, 'skipped': 0}
+        assert not CacheLock('scrape-news-task:tech').is_locked()
@@ -0,0 +1,88 @@
+import pytest
+from news.scrape_schedule import AdaptiveSchedule
+from news.tasks import scrape_news_task, schedule_scrape_news_task, discover_news_task
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def bounds(settings):
+    settings.SCRAPER_MIN_INTERVAL = 30
+    settings.SCRAPER_MAX_INTERVAL = 120
+
+
+class TestAdaptiveSchedule:
+
+    def test_interval_stretches_when_nothing_is_new(self, stand_in_site, bounds):
+        # arrange
+        schedule = AdaptiveSchedule('tech')
+
+        # act
+        intervals = [schedule.record_run(0) for _ in range(5)]
+
+        # assert
+        assert intervals == [45, 67.5, 101.25, 120, 120]
+
+    def test_interval_shrinks_on_new_articles(self, stand_in_site, bounds):
+        # arrange
+        schedule = AdaptiveSchedule('tech')
+        schedule.record_run(0)
+        schedule.record_run(0)
+
+        # act
+        intervals = [schedule.record_run(3) for _ in range(2)]
+
+        # assert
+        assert intervals == [33.75, 30]
+
+    def test_unchanged_listing_skips_known_url_lookups(self, stand_in_site):
+        # arrange
+        scrape_news_task()
+        stand_in_site.hits.clear()
+        seen = []
+
+        # act
+        AdaptiveSchedule('tech').page_filter(lambda urls: seen.append(urls) or urls)(stand_in_site.article_urls(1))
+
+        # assert
+        assert seen == []
+
+    def test_changed_listing_is_crawled(self, stand_in_site):
+        # arrange
+        scrape_news_task()
+        stand_in_site.articles_per_page = 6
+        stand_in_site.hits.clear()
+
+        # act
+        result = scrape_news_task()
+
+        # assert
+        assert result.startswith('Success: 2 articles')
+        assert stand_in_site.article_hits() == {'/article-1-5': 1, '/article-2-5': 1}
+
+    def test_failed_article_is_retried_while_listing_is_unchanged(self, stand_in_site):
+        # arrange
+        stand_in_site.inject_faults('/article-1-2', [404])
+        scrape_news_task()
+        stand_in_site.hits.clear()
+
+        # act
+        result = scrape_news_task()
+
+        # assert
+        assert result.startswith('Success: 1 articles')
+        assert stand_in_site.article_hits() == {'/article-1-2': 1}
+
+    def test_dispatcher_only_runs_due_topics(self, stand_in_site, settings, monkeypatch):
+        # arrange
+        settings.SCRAPER_TOPICS = ['tech', 'mobile']
+        AdaptiveSchedule('mobile').claim_due_run()
+        dispatched = []
+        monkeypatch.setattr(discover_news_task, 'delay', lambda **kwargs: dispatched.append(kwargs['topic']))
+
+        # act
+        result = schedule_scrape_news_task()
+
+        # assert
+        assert dispatched == ['tech']
+        assert result == 'Dispatched: tech'
@@ -0,0 +1,243 @@
+import json
+import time
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from utility import http_client
+from utility.scrape_cache import ScrapeCache
+
+pytestmark = pytest.mark.django_db
+
+
+class TestScrapedNewsEndpoint:
+    endpoint = reverse('news:news-scrape')
+
+    def test_scrape_news(self, stand_in_site, api_client):
+        # act
+        response = api_client().get(f"{self.endpoint}?page_size=5")
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 5
+        assert response.data['results'][0]['title'].startswith('عنوان خبر')
+        assert response.data['stale'] is False
+        assert response.data['partial'] is False
+
+    def test_repeated_requests_are_served_from_cache(self, stand_in_site, api_client):
+        # arrange
+        api_client().get(f"{self.endpoint}?page_size=5")
+
+        # act
+        response = api_client().get(f"{self.endpoint}?keyword=خبر&page_size=5")
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 5
+        assert stand_in_site.hits['/topic/tech/page/1'] == 1
+        assert all(count == 1 for count in stand_in_site.article_hits().values())
+
+    def test_concurrent_identical_requests_scrape_once(self, stand_in_site, api_client):
+        # arrange
+        stand_in_site.article_delay = 0.2
+
+        # act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda _: api_client().get(f"{self.endpoint}?topic=tech&page=1&page_size=5"), range(8)))
+
+        # assert
+        assert all(response.status_code == status.HTTP_200_OK for response in responses)
+        assert all(len(response.data['results']) == 5 for response in responses)
+        assert stand_in_site.hits['/topic/tech/page/1'] == 1
+        assert stand_in_site.article_hits() == {url.split(stand_in_site.base_url)[1]: 1
+                                                for url in stand_in_site.article_urls(1)}
+
+    def test_last_good_result_is_served_while_upstream_is_down(self, stand_in_site, api_client):
+        # arrange
+        api_client().get(f"{self.endpoint}?page_size=5")
+        cache.delete(ScrapeCache().make_key(1, 'tech'))
+        breaker = http_client.get_http_client().breaker_for(stand_in_site.base_url)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        stand_in_site.hits.clear()
+
+        # act
+        response = api_client().get(f"{self.endpoint}?page_size=5")
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 5
+        assert response.data['stale'] is True
+        assert 'fetched_at' in response.data
+        assert stand_in_site.hits == {}
+
+    def test_upstream_down_without_cached_result(self, stand_in_site, api_client):
+        # arrange
+        breaker = http_client.get_http_client().breaker_for(stand_in_site.base_url)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        # act
+        response = api_client().get(self.endpoint)
+
+        # assert
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    def test_ndjson_streams_filtered_articles(self, stand_in_site, api_client):
+        # act
+        response = api_client().get(f"{self.endpoint}?format=ndjson&exclude_keyword=1-3")
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert len(lines) == 4
+        assert all(json.loads(line)['title'].startswith('عنوان خبر') for line in lines)
+
+    def test_ndjson_first_article_arrives_before_the_crawl_ends(self, stand_in_site, api_client, settings):
+        # arrange
+        settings.SCRAPER_MAX_WORKERS = 1
+        stand_in_site.article_delay = 0.3
+
+        # act
+        started = time.monotonic()
+        response = api_client().get(f"{self.endpoint}?format=ndjson")
+        content = iter(response.streaming_content)
+        first_line = next(content)
+        time_to_first_article = time.monotonic() - started
+        rest = list(content)
+        total = time.monotonic() - started
+
+        # assert
+        assert json.loads(first_line)['source'] == stand_in_site.article_url(1, 0)
+        assert len(rest) == 4
+        assert time_to_first_article < total / 2
+
+    def test_ndjson_stream_is_cached_for_later_requests(self, stand_in_site, api_client):
+        # arrange
+        list(api_client().get(f"{self.endpoint}?format=ndjson").streaming_content)
+
+        # act
+        response = api_client().get(f"{self.endpoint}?page_size=5")
+
+        # assert
+        assert len(response.data['results']) == 5
+        assert stand_in_site.hits['/topic/tech/page/1'] == 1
+
+    def test_deadline_returns_partial_result(self, stand_in_site, api_client, settings):
+        # arrange
+        settings.SCRAPER_MAX_WORKERS = 2
+        stand_in_site.article_delay = 0.4
+
+        # act
+        response = api_client().get(f"{self.endpoint}?deadline=0.6")
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['partial'] is True
+        assert len(response.data['results']) == 2
+        assert response.data['skipped_urls'] == stand_in_site.article_urls(1)[2:]
+        assert cache.get(ScrapeCache().make_key(1, 'tech')) is None
+
+    def test_deadline_bounds_listing_retries(self, stand_in_site, api_client):
+        # arrange
+        stand_in_site.inject_faults('/topic/tech/page/1', [503, 503, 503, 503], retry_after=5)
+
+        # act
+        started = time.perf_counter()
+        response = api_client().get(f"{self.endpoint}?deadline=2")
+        elapsed = time.perf_counter() - started
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['partial'] is True
+        assert response.data['skipped_urls'] == [stand_in_site.listing_url()]
+        assert elapsed < 2
+
+    def test_page_cap_is_flagged_truncated_not_partial(self, stand_in_site, api_client, settings):
+        # arrange
+        settings.SCRAPER_MAX_UPSTREAM_PAGES = 1
+
+        # act
+        response = api_client().get(f"{self.endpoint}?page_size=10")
+
+        # assert
+        assert len(response.data['results']) == 5
+        assert response.data['truncated'] is True
+        assert response.data['partial'] is False
+        assert 'skipped_urls' not in response.data
+        assert response.data['next'] is not None
+
+    def test_count_is_null_until_the_listing_is_exhausted(self, stand_in_site, api_client):
+        # act
+        first_page = api_client().get(f"{self.endpoint}?page_size=3")
+        whole_listing = api_client().get(f"{self.endpoint}?page_size=20")
+
+        # assert
+        assert first_page.data['count'] is None
+        assert first_page.data['next'] is not None
+        assert whole_listing.data['count'] == 10
+        assert whole_listing.data['next'] is None
+
+    def test_ordering_sorts_the_whole_result_set(self, stand_in_site, api_client):
+        # act
+        response = api_client().get(f"{self.endpoint}?ordering=-title&page_size=3")
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 10
+        assert [item['title'] for item in response.data['results']] == [
+            'عنوان خبر 2-4', 'عنوان خبر 2-3', 'عنوان خبر 2-2'
+        ]
+        assert 'page=2' in response.data['next']
+
+    def test_invalid_deadline(self, api_client):
+        # act
+        response = api_client().get(f"{self.endpoint}?deadline=-1")
+
+        # assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_deep_page_is_filled_from_later_upstream_pages(self, stand_in_site, api_client):
+        # act
+        response = api_client().get(f"{self.endpoint}?page=2&page_size=3")
+
+        # assert
+        assert [item['source'] for item in response.data['results']] == (
+            stand_in_site.article_urls(1)[3:] + stand_in_site.article_urls(2)[:1]
+        )
+        assert stand_in_site.hits['/topic/tech/page/2'] == 1
+        assert stand_in_site.hits['/topic/tech/page/3'] == 0
+
+    def test_next_cursor_resumes_at_the_upstream_position(self, stand_in_site, api_client):
+        # arrange
+        first = api_client().get(f"{self.endpoint}?page_size=4&exclude_keyword=1-1")
+        stand_in_site.hits.clear()
+
+        # act
+        second = api_client().get(first.data['next'])
+
+        # assert
+        assert [item['source'] for item in first.data['results']] == [
+            stand_in_site.article_url(1, index) for index in (0, 2, 3, 4)
+        ]
+        assert [item['source'] for item in second.data['results']] == stand_in_site.article_urls(2)[:4]
+        assert second.data['previous'].endswith('page=1')
+        assert stand_in_site.hits['/topic/tech/page/1'] == 0
+
+    def test_count_is_exact_once_upstream_is_exhausted(self, stand_in_site, api_client):
+        # act
+        response = api_client().get(f"{self.endpoint}?page_size=50")
+
+        # assert
+        assert response.data['count'] == 10
+        assert response.data['next'] is None
+
+    def test_invalid_cursor(self, api_client):
+        # act
+        response = api_client().get(f"{self.endpoint}?cursor=not-a-cursor")
+
+        # assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,6 +1,7 @@
 from django.urls import path
 
-from news.views import news_list_view, news_create_view, news_update_view, news_remove_view, scrap_news_view
+from news.views import news_list_view, news_create_view, news_update_view, news_remove_view, scrap_news_view, \
+    scrape_job_view, news_detail_view
 
 app_name = 'news'
 
@@ -10,5 +11,8 @@ urlpatterns = [
     path('<str:news_id>/update/', news_update_view.UpdateNewsView.as_view(), name='news-update'),
     path('<str:news_id>/remove/', news_remove_view.RemoveNewsView.as_view(), name='news-remove'),
     path('scrape/', scrap_news_view.ScrapedNewsView.as_view(), name='news-scrape'),
+    path('scrape/jobs/', scrape_job_view.ScrapeJobCreateView.as_view(), name='news-scrape-job-create'),
+    path('scrape/jobs/<str:job_id>/', scrape_job_view.ScrapeJobStatusView.as_view(), name='news-scrape-job'),
+    path('<uuid:news_id>/', news_detail_view.NewsDetailView.as_view(), name='news-detail'),
 
 ]
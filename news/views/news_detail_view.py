@@ -0,0 +1,113 @@
+from drf_spectacular.types import OpenApiTypes
+from rest_framework import status
+from django.shortcuts import get_object_or_404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from news.models.news_model import News
+from news.serializers.news_ser import NewsSerializer, NewsTagNamesSerializer
+from rest_framework.permissions import AllowAny
+from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiResponse, OpenApiParameter
+
+
+class NewsDetailView(APIView):
+    """
+    API view to retrieve a single news article with its full text.
+
+    The news list only carries excerpts, this endpoint serves the article body.
+    No authentication is required to access this endpoint.
+    """
+    permission_classes = [AllowAny]
+    serializer_class = NewsSerializer
+    tag_names_serializer_class = NewsTagNamesSerializer
+
+    def get_serializer_class(self):
+        if self.request.query_params.get('tag_names', '').lower() in ('true', '1'):
+            return self.tag_names_serializer_class
+        return self.serializer_class
+
+    @extend_schema(
+        tags=['News'],
+        operation_id='retrieve_news',
+        summary='Retrieve a news article',
+        description='''
+        This endpoint returns a single news article by its ID, including its full text.
+
+        **Features**:
+        - Full article text alongside the excerpt shown in the news list
+        - `tag_names=true` renders tags by name instead of by id
+        - Returns 404 if article doesn't exist
+
+        **Authentication**:
+        - No authentication required
+        ''',
+        parameters=[
+            OpenApiParameter(
+                name='news_id',
+                type=OpenApiTypes.UUID,
+                location=OpenApiParameter.PATH,
+                description='UUID of the news article to retrieve',
+                required=True
+            ),
+            OpenApiParameter(
+                name='tag_names',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description='Render tags by name instead of by id',
+                required=False
+            )
+        ],
+        responses={
+            200: OpenApiResponse(
+                response=NewsSerializer,
+                description='News article retrieved successfully',
+                examples=[
+                    OpenApiExample(
+                        'Successful Response',
+                        value={
+                            "id": "e8bc413e-2b26-49e9-a3da-e0a4dc9f3568",
+                            "title": "test news 2",
+                            "text": "ergergerg",
+                            "excerpt": "ergergerg",
+                            "source": "test source",
+                            "created_at": "2025-05-08T17:44:10.279522Z",
+                            "updated_at": "2025-05-08T17:44:10.279522Z",
+                            "tags": [
+                                "e34f422a-19a3-4ae6-a998-1254612f5e4a"
+                            ]
+                        },
+                        response_only=True
+                    )
+                ]
+            ),
+            404: OpenApiResponse(
+                description='News article not found',
+                examples=[
+                    OpenApiExample(
+                        'Not Found',
+                        value={
+                            "detail": "Not found."
+                        },
+                        response_only=True
+                    )
+                ]
+            )
+        }
+    )
+    def get(self, request, news_id):
+        """
+        Retrieve a specific news article.
+
+        Args:
+            request: HTTP request object
+            news_id: UUID of the news article to retrieve
+
+        Returns:
+            Response: Serialized news article with HTTP 200 status
+
+        Raises:
+            Http404: If the news article doesn't exist
+        """
+        news = get_object_or_404(News.objects.prefetch_related('tags').defer('search_vector'), id=news_id)
+        serializer = self.get_serializer_class()(news)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
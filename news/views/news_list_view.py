@@ -1,8 +1,10 @@
 from drf_spectacular.types import OpenApiTypes
 from rest_framework.generics import ListAPIView
-from news.serializers.news_ser import NewsSerializer
+from news.serializers.news_ser import (
+    NewsSerializer, NewsTagNamesSerializer, NewsListSerializer, NewsListTagNamesSerializer
+)
 from news.models.news_model import News
-from utility.pagination import Pagination
+from utility.pagination import Pagination, KeysetPagination
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
@@ -18,14 +20,50 @@ class NewsListView(ListAPIView):
     No authentication is required to access this endpoint.
     """
     permission_classes = [AllowAny]
-    serializer_class = NewsSerializer
-    queryset = News.objects.all().order_by('-created_at')
+    serializer_class = NewsListSerializer
+    tag_names_serializer_class = NewsListTagNamesSerializer
+    full_text_serializer_class = NewsSerializer
+    full_text_tag_names_serializer_class = NewsTagNamesSerializer
+    # Tags of a whole page are read in one query instead of one per article
+    queryset = News.objects.prefetch_related('tags').defer('search_vector').order_by('-created_at')
     pagination_class = Pagination
+    cursor_pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend]
     filterset_class = NewsFilter
     search_fields = ['title', 'tags']
     ordering_fields = ['created_at', 'updated_at']
 
+    def query_flag(self, name):
+        return self.request.query_params.get(name, '').lower() in ('true', '1')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not self.query_flag('full_text'):
+            # Lists show the stored excerpt, the article bodies are never read
+            queryset = queryset.defer('text')
+        return queryset
+
+    def get_serializer_class(self):
+        if self.query_flag('full_text'):
+            if self.query_flag('tag_names'):
+                return self.full_text_tag_names_serializer_class
+            return self.full_text_serializer_class
+        if self.query_flag('tag_names'):
+            return self.tag_names_serializer_class
+        return self.serializer_class
+
+    @property
+    def paginator(self):
+        """
+        The paginator of the request: page numbers by default, keyset cursors with pagination=cursor
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     @extend_schema(
         tags=['News'],
         operation_id='list_news',
@@ -37,15 +75,51 @@ class NewsListView(ListAPIView):
         - Pagination support
         - Multiple filtering options
         - Tag-based filtering
+        - Articles are listed with a short `excerpt`; `full_text=true` adds the full `text`,
+          which is also served by the news detail endpoint
+        - `tag_names=true` renders tags by name instead of by id
         - Keyword search in content and title
+        - Ranked full-text search with highlighted headlines
         - Sorting by creation and update time
+        - `pagination=cursor` switches to keyset pagination: constant time at any depth,
+          newest first, with `next`/`previous` cursor links and no `count`
 
         **Filtering Options**:
         - Filter by single or multiple tags
         - Search by keywords in content and title
         - Exclude articles containing specific keywords
+        - `search` runs an indexed full-text search; results are ordered by relevance and
+          carry `rank` and a `headline` snippet with the matches wrapped in `<mark>`
         ''',
         parameters=[
+            OpenApiParameter(
+                name='pagination',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Pagination mode: page (default) or cursor',
+                required=False
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Opaque cursor from the next or previous link (cursor pagination only)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='full_text',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description='Include the full article text instead of only the excerpt',
+                required=False
+            ),
+            OpenApiParameter(
+                name='tag_names',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description='Render tags by name instead of by id',
+                required=False
+            ),
             OpenApiParameter(
                 name='tags',
                 type=OpenApiTypes.STR,
@@ -87,11 +161,18 @@ class NewsListView(ListAPIView):
                 location=OpenApiParameter.QUERY,
                 description='Exclude news containing any of these keywords (comma separated)',
                 required=False
+            ),
+            OpenApiParameter(
+                name='search',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Full-text search in title and content ("quoted phrase", or, -excluded)',
+                required=False
             )
         ],
         responses={
             200: OpenApiResponse(
-                response=NewsSerializer,
+                response=NewsListSerializer,
                 description='List of news articles retrieved successfully',
                 examples=[
                     OpenApiExample(
@@ -101,7 +182,7 @@ class NewsListView(ListAPIView):
                             {
                                 "id": "e8bc413e-2b26-49e9-a3da-e0a4dc9f3568",
                                 "title": "test news 2",
-                                "text": "ergergerg",
+                                "excerpt": "ergergerg",
                                 "source": "test source",
                                 "created_at": "2025-05-08T17:44:10.279522Z",
                                 "updated_at": "2025-05-08T17:44:10.279522Z",
@@ -112,7 +193,7 @@ class NewsListView(ListAPIView):
                             {
                                 "id": "94c9000c-5ef3-443a-9d59-4746e5586d23",
                                 "title": "test news 1",
-                                "text": "swewgwg  yo",
+                                "excerpt": "swewgwg yo",
                                 "source": "test source",
                                 "created_at": "2025-05-08T17:43:59.377890Z",
                                 "updated_at": "2025-05-08T18:03:23.160069Z",
@@ -5,7 +5,16 @@ from news.serializers.news_ser import NewsSerializer
 from rest_framework.permissions import AllowAny
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 from rest_framework.response import Response
-from utility.scraper import scrape_digiato_news
+from rest_framework.settings import api_settings
+from django.http import StreamingHttpResponse
+from datetime import datetime, timezone
+from django.conf import settings
+from utility.deadline import Deadline
+from utility.http_client import CircuitOpenError
+from utility.keyword_matcher import KeywordMatcher
+from utility.renderers import NDJSONRenderer
+from utility.scrape_cache import cached_scrape_stream
+from utility.upstream_pager import UpstreamPager, encode_cursor, decode_cursor
 
 
 class ScrapedNewsView(APIView):
@@ -17,6 +26,7 @@ class ScrapedNewsView(APIView):
     """
     permission_classes = [AllowAny]
     serializer_class = NewsSerializer
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES + [NDJSONRenderer]
 
     @extend_schema(
         tags=['News'],
@@ -28,17 +38,34 @@ class ScrapedNewsView(APIView):
         **Features**:
         - Returns raw scraped data with full article text
         - Advanced filtering support (keywords, exclusions)
-        - Pagination support
+        - Pagination over the filtered results; Digiato listing pages are pulled lazily until the page is filled
+        - `count` is null until the Digiato listing has been read to its end, follow `next` until it is set
         - Topic selection support
-        - Sorting capabilities
+        - `ordering` sorts the whole filtered result set: every listing page (up to the server cap) is read
+          first, `count` is exact and pages are numbered instead of using cursors
         - No database persistence
+        - Scrape results are cached per topic and page; stale results are served while they refresh
+        - While Digiato is unavailable the last good result is served with `stale: true`
+        - `format=ndjson` streams one article per line as soon as it is extracted and matches the
+          keyword filters (sorting and pagination do not apply)
+        - `deadline` bounds the scrape time; when it runs out the completed articles are returned
+          with `partial: true` and the `skipped_urls`
+        - `truncated: true` means the server cap on listing pages read per request was reached;
+          follow `next` for the rest
         ''',
         parameters=[
             OpenApiParameter(
                 name='page',
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
-                description='Page number to scrape',
+                description='Page of the filtered results (the Digiato listing page in ndjson mode)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Opaque cursor from the next link, resumes at the upstream position it encodes',
                 required=False
             ),
             OpenApiParameter(
@@ -83,11 +110,26 @@ class ScrapedNewsView(APIView):
                 description='Exclude news containing any of these keywords (comma separated)',
                 required=False
             ),
+            OpenApiParameter(
+                name='deadline',
+                type=OpenApiTypes.FLOAT,
+                location=OpenApiParameter.QUERY,
+                description='Time budget of the scrape in seconds (default and maximum set by the server)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='format',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Response format: json (default) or ndjson to stream articles as they are scraped',
+                required=False
+            ),
             OpenApiParameter(
                 name='ordering',
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
-                description='Order results by field (created_at, -created_at, title, -title)',
+                description='Order the whole result set by field (created_at, -created_at, title, -title); '
+                            'reads every listing page before answering',
                 required=False
             )
         ],
@@ -101,6 +143,9 @@ class ScrapedNewsView(APIView):
                             'count': 20,
                             'next': 'https://api.example.com/scraped-news/?page=2',
                             'previous': None,
+                            'stale': False,
+                            'partial': False,
+                            'truncated': False,
                             'results': [
                                 {
                                     "id": "94c9000c-5ef3-443a-9d59-4746e5586d23",
@@ -136,7 +181,8 @@ class ScrapedNewsView(APIView):
                         response_only=True
                     )
                 ]
-            )
+            ),
+            503: OpenApiResponse(description='Digiato is unavailable and nothing is cached for this page')
         }
     )
     def get(self, request, *args, **kwargs):
@@ -167,6 +213,23 @@ class ScrapedNewsView(APIView):
 
             topic = request.query_params.get('topic', 'tech')
 
+            # Get the time budget, capped by the server maximum
+            max_deadline = getattr(settings, 'SCRAPER_MAX_REQUEST_DEADLINE', 60)
+            deadline_seconds = request.query_params.get('deadline', getattr(settings, 'SCRAPER_REQUEST_DEADLINE', 20))
+            try:
+                deadline_seconds = float(deadline_seconds)
+                if deadline_seconds <= 0:
+                    raise ValueError
+            except ValueError:
+                return Response(
+                    {'error': 'Deadline must be a positive number of seconds'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            deadline = Deadline(min(deadline_seconds, max_deadline))
+
+            if request.accepted_renderer.format == NDJSONRenderer.format:
+                return self.stream_ndjson(page_number, topic, request.query_params, deadline)
+
             # Get page size
             page_size = request.query_params.get('page_size', '10')
             try:
@@ -182,19 +245,45 @@ class ScrapedNewsView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Scrape news
-            news_items = scrape_digiato_news(page_number=page_number, topic=topic)
+            ordering = request.query_params.get('ordering')
+            if ordering:
+                return self.get_sorted(request, topic, page_number, page_size, ordering, deadline)
 
-            # Apply filters
-            filtered_items = self.apply_filters(news_items, request.query_params)
-
-            # Apply sorting
-            sorted_items = self.apply_sorting(filtered_items, request.query_params.get('ordering'))
+            # Resume from the upstream position of a cursor, or count matching items from the start
+            cursor = request.query_params.get('cursor')
+            if cursor:
+                try:
+                    upstream_page, offset, page_number = decode_cursor(cursor)
+                except ValueError:
+                    return Response(
+                        {'error': 'Invalid cursor'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                skip = 0
+            else:
+                upstream_page, offset = 1, 0
+                skip = (page_number - 1) * page_size
+
+            # Pull upstream pages (served from the shared cache) until the page is filled
+            pager = UpstreamPager(
+                topic=topic,
+                item_filter=KeywordMatcher.from_query_params(request.query_params).matches,
+                deadline=deadline,
+            )
+            try:
+                collected = pager.collect(skip + page_size, upstream_page, offset)
+            except CircuitOpenError:
+                return Response(
+                    {'error': 'News source is temporarily unavailable'},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE
+                )
 
-            # Apply pagination
-            paginated_items = self.paginate_items(sorted_items, page_size, page_number, request)
+            # Items keep the listing order, newest first
+            paginated_items = self.paginate_upstream(
+                collected['items'][skip:], collected, page_size, page_number, skip, request
+            )
 
-            return Response(paginated_items, status=status.HTTP_200_OK)
+            return Response(self.add_result_flags(paginated_items, collected), status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
@@ -202,68 +291,164 @@ class ScrapedNewsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+    def get_sorted(self, request, topic, page_number, page_size, ordering, deadline):
+        """
+        Serve a page of the whole filtered result set in the requested order.
+
+        Sorting needs every item, so the upstream listing is read to its end
+        (up to SCRAPER_MAX_UPSTREAM_PAGES pages) before it is sorted, counted
+        and sliced. Pages are numbered, cursors do not apply.
+
+        Args:
+            request: HTTP request object
+            topic: Topic to scrape
+            page_number: Current page number
+            page_size: Number of items per page
+            ordering: Ordering parameter
+            deadline: Deadline bounding the scrape
+
+        Returns:
+            Response with the exact count and the sorted page
+        """
+        pager = UpstreamPager(
+            topic=topic,
+            item_filter=KeywordMatcher.from_query_params(request.query_params).matches,
+            deadline=deadline,
+        )
+        try:
+            collected = pager.collect(None)
+        except CircuitOpenError:
+            return Response(
+                {'error': 'News source is temporarily unavailable'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        sorted_items = self.apply_sorting(collected['items'], ordering)
+        paginated_items = self.paginate_items(sorted_items, page_size, page_number, request)
+        return Response(self.add_result_flags(paginated_items, collected), status=status.HTTP_200_OK)
+
+    def add_result_flags(self, paginated_items, collected):
+        """
+        Flag results cut short by the deadline or the page cap, or served from the last good scrape
+
+        Args:
+            paginated_items: Response data of the page
+            collected: Result of UpstreamPager.collect
+
+        Returns:
+            The response data with the partial, truncated and stale flags
+        """
+        paginated_items['truncated'] = collected['truncated']
+        paginated_items['partial'] = collected['partial']
+        if collected['partial']:
+            paginated_items['skipped_urls'] = collected['skipped_urls']
+
+        # Flag results served from the last good scrape while the upstream is down
+        paginated_items['stale'] = collected['stale']
+        if collected['stale']:
+            paginated_items['fetched_at'] = datetime.fromtimestamp(
+                collected['fetched_at'], tz=timezone.utc
+            ).isoformat()
+        return paginated_items
+
+    def paginate_upstream(self, items, collected, page_size, page_number, skip, request):
+        """
+        Build the pagination details of a page filled by UpstreamPager.
+
+        The next link carries a cursor with the upstream position reached, so
+        deeper pages never pull the earlier upstream pages again. The total count
+        is only known once the upstream listing is exhausted, it is None before.
+
+        Args:
+            items: Items of the current page
+            collected: Result of UpstreamPager.collect
+            page_size: Number of items per page
+            page_number: Current page number
+            skip: Number of collected items before the current page
+            request: HTTP request object
+
+        Returns:
+            Dictionary with pagination details and results
+        """
+        total_items = None
+        if collected['exhausted']:
+            total_items = (page_number - 1) * page_size - skip + len(collected['items'])
+
+        base_url = request.build_absolute_uri().split('?')[0]
+
+        # Next page
+        next_page = None
+        if collected['next_position'] is not None:
+            query_params = request.query_params.copy()
+            query_params.pop('page', None)
+            query_params['cursor'] = encode_cursor(*collected['next_position'], page_number + 1)
+            next_page = f"{base_url}?{query_params.urlencode()}"
+
+        # Previous page
+        previous_page = None
+        if page_number > 1:
+            query_params = request.query_params.copy()
+            query_params.pop('cursor', None)
+            query_params['page'] = str(page_number - 1)
+            previous_page = f"{base_url}?{query_params.urlencode()}"
+
+        return {
+            'count': total_items,
+            'next': next_page,
+            'previous': previous_page,
+            'results': [item.as_dict() for item in items]
+        }
+
+    def stream_ndjson(self, page_number, topic, query_params, deadline=None):
+        """
+        Stream the scraped news as NDJSON, one filtered article per line.
+
+        When the deadline cuts the stream short, a last line holds
+        {"partial": true, "skipped_urls": [...]}.
+
+        Args:
+            page_number: Page number to scrape
+            topic: Topic to scrape
+            query_params: Request query parameters holding the keyword filters
+            deadline: Optional Deadline bounding the scrape
+
+        Returns:
+            StreamingHttpResponse emitting articles as soon as they are extracted
+        """
+        try:
+            news_items = cached_scrape_stream(page_number=page_number, topic=topic, deadline=deadline)
+        except CircuitOpenError:
+            return Response(
+                {'error': 'News source is temporarily unavailable'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        matcher = KeywordMatcher.from_query_params(query_params)
+
+        def lines():
+            for item in news_items:
+                if matcher.matches(item):
+                    yield NDJSONRenderer.render_line(item.as_dict())
+            if deadline is not None and deadline.partial:
+                yield NDJSONRenderer.render_line({'partial': True, 'skipped_urls': deadline.skipped})
+
+        response = StreamingHttpResponse(lines(), content_type=NDJSONRenderer.media_type)
+        # Ask nginx not to buffer, so each line reaches the client right away
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
     def apply_filters(self, news_items, query_params):
         """
         Apply keyword filters to the scraped news items.
 
         Args:
-            news_items: List of news items
+            news_items: List of ScrapedArticle records
             query_params: Request query parameters
 
         Returns:
             Filtered list of news items
         """
-        filtered_items = news_items
-
-        # Filter by single keyword
-        keyword = query_params.get('keyword')
-        if keyword:
-            filtered_items = [
-                item for item in filtered_items
-                if keyword.lower() in item.get('title', '').lower() or
-                   keyword.lower() in item.get('content', '').lower() or
-                   keyword.lower() in item.get('text', '').lower()
-            ]
-
-        # Filter by multiple keywords (any match)
-        keywords = query_params.get('keywords')
-        if keywords:
-            keyword_list = [k.strip().lower() for k in keywords.split(',')]
-            filtered_items = [
-                item for item in filtered_items
-                if any(
-                    k in item.get('title', '').lower() or
-                    k in item.get('content', '').lower() or
-                    k in item.get('text', '').lower()
-                    for k in keyword_list
-                )
-            ]
-
-        # Exclude by single keyword
-        exclude_keyword = query_params.get('exclude_keyword')
-        if exclude_keyword:
-            filtered_items = [
-                item for item in filtered_items
-                if exclude_keyword.lower() not in item.get('title', '').lower() and
-                   exclude_keyword.lower() not in item.get('content', '').lower() and
-                   exclude_keyword.lower() not in item.get('text', '').lower()
-            ]
-
-        # Exclude by multiple keywords
-        exclude_keywords = query_params.get('exclude_keywords')
-        if exclude_keywords:
-            exclude_keyword_list = [k.strip().lower() for k in exclude_keywords.split(',')]
-            filtered_items = [
-                item for item in filtered_items
-                if not any(
-                    k in item.get('title', '').lower() or
-                    k in item.get('content', '').lower() or
-                    k in item.get('text', '').lower()
-                    for k in exclude_keyword_list
-                )
-            ]
-
-        return filtered_items
+        return KeywordMatcher.from_query_params(query_params).filter(news_items)
 
     def apply_sorting(self, news_items, ordering):
         """
@@ -278,7 +463,7 @@ class ScrapedNewsView(APIView):
         """
         if not ordering:
             # Default to sorting by created_at (newest first)
-            return sorted(news_items, key=lambda x: x.get('created_at', ''), reverse=True)
+            return sorted(news_items, key=lambda x: getattr(x, 'created_at', ''), reverse=True)
 
         reverse = False
         if ordering.startswith('-'):
@@ -289,9 +474,9 @@ class ScrapedNewsView(APIView):
 
         if ordering not in valid_fields:
             # Fall back to default if invalid field
-            return sorted(news_items, key=lambda x: x.get('created_at', ''), reverse=True)
+            return sorted(news_items, key=lambda x: getattr(x, 'created_at', ''), reverse=True)
 
-        return sorted(news_items, key=lambda x: x.get(ordering, ''), reverse=reverse)
+        return sorted(news_items, key=lambda x: getattr(x, ordering, ''), reverse=reverse)
 
     def paginate_items(self, items, page_size, page_number, request):
         """
@@ -335,5 +520,5 @@ class ScrapedNewsView(APIView):
             'count': total_items,
             'next': next_page,
             'previous': previous_page,
-            'results': current_page_items
+            'results': [item.as_dict() for item in current_page_items]
         }
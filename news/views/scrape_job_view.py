@@ -0,0 +1,199 @@
+from drf_spectacular.types import OpenApiTypes
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from django.urls import reverse
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
+from news import scrape_jobs
+from news.tasks import scrape_job_task
+from news.views.scrap_news_view import ScrapedNewsView
+
+
+class ScrapeJobCreateView(APIView):
+    """
+    API view to start an asynchronous scrape job.
+
+    The scrape runs in a Celery worker, so the web worker answers right away
+    with a job id instead of waiting for the upstream crawl.
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        tags=['News'],
+        operation_id='create_scrape_job',
+        summary='Start an asynchronous scrape job',
+        description='''
+        This endpoint enqueues a scrape of one Digiato listing page and returns immediately.
+
+        **Features**:
+        - Returns 202 with a job id and the URL to poll
+        - The scrape runs in a Celery worker instead of the web worker
+        - Results are available from the job status endpoint once ready
+        ''',
+        parameters=[
+            OpenApiParameter(
+                name='page',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Page number to scrape',
+                required=False
+            ),
+            OpenApiParameter(
+                name='topic',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Topic to scrape (default: "tech")',
+                required=False
+            )
+        ],
+        request=None,
+        responses={
+            202: OpenApiResponse(
+                description='Scrape job accepted',
+                examples=[
+                    OpenApiExample(
+                        'Accepted Response',
+                        value={
+                            'job_id': '2f0c6f0e4b7a4d5c9a3f1e8b7c6d5a4b',
+                            'status': 'pending',
+                            'status_url': 'https://api.example.com/api/v1/news/scrape/jobs/2f0c6f0e4b7a4d5c9a3f1e8b7c6d5a4b/'
+                        },
+                        response_only=True
+                    )
+                ]
+            ),
+            400: OpenApiResponse(description='Invalid page number')
+        }
+    )
+    def post(self, request, *args, **kwargs):
+        """
+        Enqueue a scrape job.
+
+        Args:
+            request: HTTP request object with optional page and topic
+
+        Returns:
+            Response: 202 with the job id and status URL
+        """
+        page_number = request.data.get('page') or request.query_params.get('page', '1')
+        try:
+            page_number = int(page_number)
+            if page_number < 1:
+                raise ValueError
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'Page number must be a positive integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        topic = request.data.get('topic') or request.query_params.get('topic', 'tech')
+
+        job = scrape_jobs.create_job(page_number, topic)
+        scrape_job_task.delay(job['job_id'])
+
+        status_url = request.build_absolute_uri(reverse('news:news-scrape-job', args=[job['job_id']]))
+        return Response(
+            {'job_id': job['job_id'], 'status': job['status'], 'status_url': status_url},
+            status=status.HTTP_202_ACCEPTED
+        )
+
+
+class ScrapeJobStatusView(ScrapedNewsView):
+    """
+    API view to poll a scrape job and read its results.
+
+    Finished jobs return their articles with the same filtering, sorting and
+    pagination as the synchronous scrape endpoint.
+    """
+
+    @extend_schema(
+        tags=['News'],
+        operation_id='get_scrape_job',
+        summary='Get scrape job status and results',
+        description='''
+        This endpoint returns the status and progress of a scrape job, and its paginated results once done.
+
+        **Features**:
+        - Status: pending, running, done or failed
+        - Progress as completed / total articles
+        - Keyword filters, sorting and pagination on finished results
+        ''',
+        parameters=[
+            OpenApiParameter(
+                name='job_id',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description='Id of the scrape job',
+                required=True
+            ),
+            OpenApiParameter(
+                name='page',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Page of the results',
+                required=False
+            ),
+            OpenApiParameter(
+                name='page_size',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Number of items per page',
+                required=False
+            )
+        ],
+        responses={
+            200: OpenApiResponse(
+                description='Job status retrieved successfully',
+                examples=[
+                    OpenApiExample(
+                        'Running Job',
+                        value={
+                            'job_id': '2f0c6f0e4b7a4d5c9a3f1e8b7c6d5a4b',
+                            'status': 'running',
+                            'progress': {'completed': 7, 'total': 20}
+                        },
+                        response_only=True
+                    )
+                ]
+            ),
+            404: OpenApiResponse(description='Job not found or expired')
+        }
+    )
+    def get(self, request, job_id, *args, **kwargs):
+        """
+        Return the status of a scrape job and its results when done.
+
+        Args:
+            request: HTTP request object with optional filter and pagination parameters
+            job_id: Id of the scrape job
+
+        Returns:
+            Response: Job status, progress and paginated results
+        """
+        job = scrape_jobs.get_job(job_id)
+        if job is None:
+            return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        data = {'job_id': job['job_id'], 'status': job['status'], 'progress': job['progress']}
+
+        if job['status'] == scrape_jobs.FAILED:
+            data['error'] = job['error']
+
+        if job['status'] == scrape_jobs.DONE:
+            try:
+                page_number = int(request.query_params.get('page', '1'))
+                page_size = int(request.query_params.get('page_size', '10'))
+                if page_number < 1 or page_size < 1 or page_size > 100:
+                    raise ValueError
+            except ValueError:
+                return Response(
+                    {'error': 'Invalid page number or page size'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            filtered_items = self.apply_filters(job['items'], request.query_params)
+            sorted_items = self.apply_sorting(filtered_items, request.query_params.get('ordering'))
+            data.update(self.paginate_items(sorted_items, page_size, page_number, request))
+
+        return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY_PREFIX = 'count:generation:'
+
+
+def generation_key(model):
+    return f"{GENERATION_KEY_PREFIX}{model._meta.label_lower}"
+
+
+def get_generation(model, cache_alias='default'):
+    # A lost counter restarts from the clock, never from a value cached entries already used
+    return caches[cache_alias].get_or_set(generation_key(model), time.time_ns(), None)
+
+
+def bump_generation(model, cache_alias='default'):
+    cache = caches[cache_alias]
+    try:
+        cache.incr(generation_key(model))
+    except ValueError:
+        cache.set(generation_key(model), time.time_ns(), None)
+
+
+def invalidate_counts(model, using=None):
+    """
+    Drop the cached counts of a model's querysets after a write
+
+    The generation is bumped right away and again once the transaction
+    commits, so a count taken by another request in between is not kept.
+
+    Args:
+        model: Model class whose rows changed
+        using: Database alias of the write
+    """
+    bump_generation(model)
+    transaction.on_commit(lambda: bump_generation(model), using=using)
+
+
+class CountStrategy:
+    """
+    Counts for paginated querysets without a COUNT(*) on every request.
+
+    Exact counts are cached per query signature, the SQL and parameters of the
+    queryset without its ordering or selected columns, so the same filters in any order or
+    spelling share one entry. The signature includes a per-model generation
+    that invalidate_counts bumps on every write. On a cache miss, Postgres is
+    asked for its planner estimate first: pg_class.reltuples for an unfiltered
+    table, the EXPLAIN row estimate otherwise. At or above estimate_threshold
+    the estimate is returned as is, since an exact count of that many rows
+    costs a scan the client does not need.
+    """
+    key_prefix = 'count:result:'
+
+    def __init__(self, estimate_threshold=None, ttl=None, cache_alias='default'):
+        self.cache_alias = cache_alias
+        self.cache = caches[cache_alias]
+        self.estimate_threshold = (
+            estimate_threshold if estimate_threshold is not None
+            else getattr(settings, 'PAGINATION_COUNT_ESTIMATE_THRESHOLD', 10000)
+        )
+        self.ttl = ttl if ttl is not None else getattr(settings, 'PAGINATION_COUNT_CACHE_TTL', 300)
+
+    def make_key(self, queryset):
+        # Only the filters decide the count, not the selected columns or annotations
+        sql, params = queryset.order_by().values('pk').query.get_compiler(queryset.db).as_sql()
+        signature = hashlib.sha1(f"{sql}|{params!r}".encode('utf-8')).hexdigest()
+        generation = get_generation(queryset.model, self.cache_alias)
+        return f"{self.key_prefix}{queryset.model._meta.label_lower}:{generation}:{signature}"
+
+    def count(self, queryset):
+        """
+        Count the rows of a queryset
+
+        Args:
+            queryset: Filtered queryset being paginated
+
+        Returns:
+            Tuple of (count, estimated)
+        """
+        key = self.make_key(queryset)
+        count = self.cache.get(key)
+        if count is not None:
+            return count, False
+
+        estimate = self.estimate(queryset)
+        if estimate is not None and estimate >= self.estimate_threshold:
+            return estimate, True
+
+        count = queryset.count()
+        self.cache.set(key, count, self.ttl)
+        return count, False
+
+    def estimate(self, queryset):
+        """
+        Planner row estimate of a queryset
+
+        Returns:
+            Estimated row count, or None when the database gives none
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        try:
+            with connection.cursor() as cursor:
+                if not queryset.query.where and not queryset.query.distinct:
+                    cursor.execute(
+                        'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                        [queryset.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                    # reltuples is -1 until the table is first analyzed
+                    return row[0] if row and row[0] >= 0 else None
+
+                sql, params = queryset.order_by().query.get_compiler(queryset.db).as_sql()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]['Plan']['Plan Rows'])
+        except Exception as e:
+            logger.warning(f"Count estimate failed for {queryset.model._meta.label}: {e}")
+            return None
@@ -0,0 +1,37 @@
+import threading
+import time
+
+
+class Deadline:
+    """
+    Time budget of one request, handed down to every step working on it.
+
+    Steps cap their waits with remaining() and record the URLs they had to give
+    up on with skip(), so the caller can report a partial result.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.skipped = []
+        self._lock = threading.Lock()
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def timeout(self, default):
+        """
+        Cap a network timeout to the time left
+        """
+        return min(default, self.remaining())
+
+    def skip(self, urls):
+        with self._lock:
+            self.skipped.extend(urls)
+
+    @property
+    def partial(self):
+        return bool(self.skipped)
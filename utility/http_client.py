@@ -0,0 +1,459 @@
+import logging
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+# urllib3 advertises "br" only when a brotli package is installed and decodes
+# gzip/deflate/brotli bodies transparently.
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml',
+    'Accept-Language': 'fa,en-US;q=0.9,en;q=0.8',
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: rate requests per second with bursts up to burst.
+
+    A Retry-After answer pauses the whole bucket, so every thread talking to
+    the same host backs off together.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """
+        Block until a token is available
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait as long as needed
+
+        Returns:
+            Seconds spent waiting, or None when no token was available within timeout
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self.paused_until:
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                    self.updated_at = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    wait = self.paused_until - now
+            if timeout is not None and waited + wait > timeout:
+                return None
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+            self.updated_at = self.paused_until
+
+
+class RetryPolicy:
+    """
+    Retry with exponential backoff and full jitter, honoring Retry-After.
+    """
+    retry_statuses = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, max_retries=None, backoff_base=None, backoff_max=None):
+        self.max_retries = max_retries if max_retries is not None else getattr(settings, 'SCRAPER_MAX_RETRIES', 3)
+        self.backoff_base = backoff_base if backoff_base is not None else getattr(settings, 'SCRAPER_BACKOFF_BASE', 0.5)
+        self.backoff_max = backoff_max if backoff_max is not None else getattr(settings, 'SCRAPER_BACKOFF_MAX', 30)
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def retry_after(self, response):
+        """
+        Seconds requested by a Retry-After header, capped at backoff_max
+
+        Returns:
+            Delay in seconds or None when the header is missing or invalid
+        """
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(delay, 0.0), self.backoff_max)
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Raised instead of sending a request while the host's circuit is open
+    """
+
+
+class DeadlineExceeded(requests.Timeout):
+    """
+    Raised when a request's deadline runs out before it could be sent or retried
+    """
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    CLOSED lets every request through. After failure_threshold consecutive
+    failures the circuit turns OPEN and requests fail fast for reset_timeout
+    seconds. Then it turns HALF_OPEN and lets up to half_open_probes requests
+    through: one success closes the circuit, one failure opens it again.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=None, reset_timeout=None, half_open_probes=None):
+        self.failure_threshold = failure_threshold or getattr(settings, 'SCRAPER_BREAKER_FAILURE_THRESHOLD', 5)
+        self.reset_timeout = reset_timeout if reset_timeout is not None else getattr(settings, 'SCRAPER_BREAKER_RESET_TIMEOUT', 30)
+        self.half_open_probes = half_open_probes or getattr(settings, 'SCRAPER_BREAKER_HALF_OPEN_PROBES', 1)
+        self._state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if self._state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self.probes = 0
+        return self._state
+
+    def allow(self):
+        """
+        Check whether a request may be sent, reserving a probe when half-open
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self.probes < self.half_open_probes:
+                self.probes += 1
+                return True
+            return False
+
+    def release_probe(self):
+        """
+        Give back a probe whose request ended without telling whether the host recovered
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self.probes > 0:
+                self.probes -= 1
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class HttpClient:
+    """
+    Pooled keep-alive HTTP client shared by the scraper functions.
+
+    One requests session is kept per host, each backed by a connection pool,
+    so repeated fetches from the same host reuse open TCP/TLS connections.
+    """
+
+    def __init__(self, pool_maxsize=None, timeout=None, headers=None, rate=None, burst=None, retry_policy=None):
+        self.pool_maxsize = pool_maxsize or getattr(settings, 'SCRAPER_POOL_MAXSIZE', 10)
+        self.timeout = timeout or getattr(settings, 'SCRAPER_TIMEOUT', 10)
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.rate = rate or getattr(settings, 'SCRAPER_RATE_LIMIT', 5)
+        self.burst = burst or getattr(settings, 'SCRAPER_RATE_BURST', 10)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._sessions = {}
+        self._buckets = {}
+        self._breakers = {}
+        self._counters = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def session_for(self, url):
+        """
+        Return the pooled session for the host of the given URL
+
+        Args:
+            url: Any URL on the target host
+
+        Returns:
+            requests.Session bound to that host
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+                logger.debug(f"Created pooled session for {host}")
+            return session
+
+    def bucket_for(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def breaker_for(self, url):
+        """
+        Return the circuit breaker of the host of the given URL
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker()
+            return breaker
+
+    def count(self, host, name):
+        with self._lock:
+            self._counters[host][name] += 1
+
+    def get(self, url, deadline=None, **kwargs):
+        """
+        Send a rate-limited GET request through the pooled session of the URL's host
+
+        Transient failures (429, 5xx, connection errors and timeouts) are retried
+        with backoff. When the retries run out, the last response is returned, or
+        the last exception is raised, and the failure counts towards opening the
+        host's circuit. While the circuit is open, CircuitOpenError is raised
+        without contacting the host.
+
+        With a deadline, every wait is capped to the time left: the rate limiter,
+        the socket timeout of each attempt and the pause before a retry. When the
+        next step would outlast the deadline, DeadlineExceeded is raised instead.
+        It never counts against the host: a half-open probe cut short this way
+        is given back for the next request.
+
+        Args:
+            url: URL to fetch
+            deadline: Optional Deadline bounding the request and its retries
+            **kwargs: Extra arguments passed to requests (headers, timeout, ...)
+
+        Returns:
+            requests.Response
+        """
+        host = urlsplit(url).netloc
+        breaker = self.breaker_for(url)
+        if not breaker.allow():
+            self.count(host, 'rejected')
+            raise CircuitOpenError(f"Circuit open for {host}, not fetching {url}")
+
+        try:
+            response = self.send_with_retries(url, deadline=deadline, **kwargs)
+        except DeadlineExceeded:
+            # Running out of the caller's budget says nothing about the host
+            breaker.release_probe()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        if response.status_code in self.retry_policy.retry_statuses:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def send_with_retries(self, url, deadline=None, **kwargs):
+        timeout = kwargs.pop('timeout', self.timeout)
+        host = urlsplit(url).netloc
+        session = self.session_for(url)
+        bucket = self.bucket_for(host)
+        policy = self.retry_policy
+
+        attempt = 0
+        while True:
+            waited = bucket.acquire(timeout=deadline.remaining() if deadline is not None else None)
+            if waited is None:
+                self.count(host, 'drops')
+                raise DeadlineExceeded(f"Deadline reached while rate limited before fetching {url}")
+            if waited:
+                self.count(host, 'throttled')
+            self.count(host, 'requests')
+
+            attempt_timeout = timeout
+            if deadline is not None:
+                attempt_timeout = deadline.timeout(timeout)
+                if attempt_timeout <= 0:
+                    self.count(host, 'drops')
+                    raise DeadlineExceeded(f"Deadline reached before attempt {attempt + 1} on {url}")
+
+            response = None
+            try:
+                response = session.get(url, timeout=attempt_timeout, **kwargs)
+                if response.status_code not in policy.retry_statuses:
+                    return response
+                error = None
+            except policy.retry_exceptions as e:
+                error = e
+
+            if deadline is not None and deadline.expired():
+                self.count(host, 'drops')
+                raise DeadlineExceeded(f"Deadline reached after {attempt + 1} attempts on {url}")
+
+            if attempt >= policy.max_retries:
+                self.count(host, 'drops')
+                logger.warning(f"Giving up on {url} after {attempt + 1} attempts")
+                if error is not None:
+                    raise error
+                return response
+
+            delay = policy.retry_after(response)
+            paused = delay is not None
+            if paused:
+                # The whole host backs off, even when this request gives up
+                bucket.pause(delay)
+            else:
+                delay = policy.backoff(attempt)
+
+            if deadline is not None and delay >= deadline.remaining():
+                self.count(host, 'drops')
+                raise DeadlineExceeded(f"Deadline reached before retrying {url} in {delay:.2f}s")
+
+            if not paused:
+                if deadline is not None and deadline.remaining() <= 0:
+                    self.count(host, 'drops')
+                    raise DeadlineExceeded(f"Deadline reached before retrying {url}")
+                time.sleep(delay)
+
+            attempt += 1
+            self.count(host, 'retries')
+            reason = error or f"HTTP {response.status_code}"
+            logger.info(f"Retrying {url} in {delay:.2f}s (attempt {attempt}, {reason})")
+
+    def retry_stats(self):
+        """
+        Report rate limiting and retry counters per host
+
+        Returns:
+            Dictionary of host -> {'requests', 'retries', 'drops', 'throttled', 'rejected'}
+        """
+        with self._lock:
+            return {
+                host: {name: counters[name] for name in ('requests', 'retries', 'drops', 'throttled', 'rejected')}
+                for host, counters in self._counters.items()
+            }
+
+    def connection_stats(self):
+        """
+        Report connection reuse per host
+
+        Returns:
+            Dictionary of host -> {'requests', 'connections', 'reused'}
+        """
+        with self._lock:
+            sessions = dict(self._sessions)
+
+        stats = {}
+        for host, session in sessions.items():
+            requests_count = 0
+            connections_count = 0
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        requests_count += pool.num_requests
+                        connections_count += pool.num_connections
+            stats[host] = {
+                'requests': requests_count,
+                'connections': connections_count,
+                'reused': max(requests_count - connections_count, 0),
+            }
+        return stats
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """
+    Return the process-wide HTTP client used by the scraper
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
+
+
+def get(url, **kwargs):
+    """
+    Send a GET request through the shared pooled client
+    """
+    return get_http_client().get(url, **kwargs)
+
+
+def connection_stats():
+    """
+    Connection reuse statistics of the shared pooled client
+    """
+    return get_http_client().connection_stats()
+
+
+def retry_stats():
+    """
+    Rate limiting and retry counters of the shared pooled client
+    """
+    return get_http_client().retry_stats()
+
+
+def circuit_is_open(url):
+    """
+    Whether requests to the host of url currently fail fast
+    """
+    return get_http_client().breaker_for(url).state == CircuitBreaker.OPEN
@@ -0,0 +1,140 @@
+import re
+
+# Up to this many keywords, one substring search per keyword, stopping at the
+# first decisive one, is faster than the single regex scan
+SUBSTRING_SEARCH_LIMIT = 128
+
+
+def split_keywords(value):
+    return [keyword.strip().lower() for keyword in value.split(',')]
+
+
+def trie_pattern(keywords):
+    """
+    Build a regex alternation of keywords factored on their common prefixes
+
+    The regex engine tries alternatives one by one, so factoring turns fifty
+    keywords into a handful of first-character branches at every position.
+    Optional tails are greedy, so the longest keyword at a position wins.
+
+    Args:
+        keywords: Non-empty keywords
+
+    Returns:
+        Regex source matching any of the keywords
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Compiled matcher for the keyword filters of the scrape endpoints.
+
+    Articles are matched against each article's normalized_text, lowercased
+    once when it was scraped, in one of two ways depending on the number of
+    distinct keywords across all filters:
+
+    - Up to SUBSTRING_SEARCH_LIMIT keywords, which covers any query typed by
+      hand, matches() runs one substring search per keyword and stops as soon
+      as the outcome is decided. This is the path almost every query takes.
+    - Above the limit, every include and exclude keyword goes into one
+      prefix-factored regex, tried at each position through a lookahead so
+      overlapping keywords are all found, and the text is scanned once. The
+      longest keyword wins at a position, and a keyword found also counts as
+      finding every other keyword it contains, so no match is lost when a
+      shorter keyword shares its start with a longer one.
+
+    found() always uses the regex scan.
+    """
+
+    def __init__(self, required=(), any_of=(), excluded=()):
+        self.required = set(required)
+        self.any_of = set(any_of)
+        self.excluded = set(excluded)
+
+        keywords = {keyword for keyword in self.required | self.any_of | self.excluded if keyword}
+        self.substring_search = len(keywords) <= SUBSTRING_SEARCH_LIMIT
+        self.pattern = None
+        if keywords:
+            self.pattern = re.compile(f"(?=({trie_pattern(keywords)}))")
+
+        # A match of one keyword implies a match of every keyword inside it
+        self.implied = {
+            keyword: {other for other in keywords if other in keyword}
+            for keyword in keywords
+        }
+
+    @classmethod
+    def from_query_params(cls, query_params):
+        """
+        Build a matcher from the keyword, keywords, exclude_keyword and exclude_keywords parameters
+        """
+        required, any_of, excluded = [], [], []
+
+        keyword = query_params.get('keyword')
+        if keyword:
+            required.append(keyword.lower())
+
+        keywords = query_params.get('keywords')
+        if keywords:
+            any_of.extend(split_keywords(keywords))
+
+        exclude_keyword = query_params.get('exclude_keyword')
+        if exclude_keyword:
+            excluded.append(exclude_keyword.lower())
+
+        exclude_keywords = query_params.get('exclude_keywords')
+        if exclude_keywords:
+            excluded.extend(split_keywords(exclude_keywords))
+
+        return cls(required, any_of, excluded)
+
+    @property
+    def is_empty(self):
+        return not (self.required or self.any_of or self.excluded)
+
+    def found(self, text):
+        """
+        Return the keywords present in a normalized text, scanning it once
+        """
+        found = {''}
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text):
+                found |= self.implied[match.group(1)]
+        return found
+
+    def matches(self, news_item):
+        if self.is_empty:
+            return True
+        if self.substring_search:
+            text = news_item.normalized_text
+            return (
+                all(keyword in text for keyword in self.required) and
+                (not self.any_of or any(keyword in text for keyword in self.any_of)) and
+                not any(keyword in text for keyword in self.excluded)
+            )
+        found = self.found(news_item.normalized_text)
+        return (
+            self.required <= found and
+            (not self.any_of or not self.any_of.isdisjoint(found)) and
+            self.excluded.isdisjoint(found)
+        )
+
+    def filter(self, news_items):
+        if self.is_empty:
+            return news_items
+        return [news_item for news_item in news_items if self.matches(news_item)]
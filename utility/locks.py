@@ -0,0 +1,135 @@
+import logging
+import threading
+import uuid
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+try:
+    from django_redis import get_redis_connection
+    from django_redis.cache import RedisCache
+except ImportError:
+    RedisCache = None
+
+# Delete the lock only if it still holds the caller's token
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Reset the lock expiry, in milliseconds, only if it still holds the caller's token
+EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class CacheLock:
+    """
+    Lock shared by all workers, stored in the Django cache.
+
+    With the Redis cache backend, acquiring is a single SET NX with an expiry,
+    so a crashed holder never keeps the lock longer than its timeout. Only the
+    holder's token can release or extend it, checked in the same Lua script
+    that deletes or expires the key, so a holder whose lease ran out can never
+    touch the next holder's lock. Other cache backends fall back to a get
+    followed by a delete or touch, which is not atomic and only fit for
+    development and tests.
+
+    With a heartbeat_interval the lock is a lease: a background thread keeps
+    extending it while the holder is alive, so long runs keep the lock and a
+    crashed holder loses it one timeout after its last heartbeat.
+    """
+
+    def __init__(self, name, timeout=60, cache_alias='default', heartbeat_interval=None, token=None):
+        self.cache = caches[cache_alias]
+        self.cache_alias = cache_alias
+        self.key = f"lock:{name}"
+        self.timeout = timeout
+        self.heartbeat_interval = heartbeat_interval
+        # A known token resumes a lock acquired elsewhere, e.g. by an earlier task of a chain
+        self.token = token or uuid.uuid4().hex
+        self.acquired = token is not None
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat_thread = None
+
+    def acquire(self):
+        self.acquired = self.cache.add(self.key, self.token, self.timeout)
+        if self.acquired and self.heartbeat_interval:
+            self.start_heartbeat()
+        return self.acquired
+
+    @property
+    def atomic(self):
+        return RedisCache is not None and isinstance(self.cache, RedisCache)
+
+    def run_script(self, script, *args):
+        """
+        Run a Lua script on the lock key with the holder's token as its first argument
+
+        Args:
+            script: Lua source comparing the key to ARGV[1]
+            *args: Further script arguments
+
+        Returns:
+            The script result
+        """
+        client = self.cache.client
+        run = get_redis_connection(self.cache_alias).register_script(script)
+        return run(keys=[client.make_key(self.key)], args=[client.encode(self.token), *args])
+
+    def release(self):
+        self.stop_heartbeat()
+        if self.acquired:
+            if self.atomic:
+                self.run_script(RELEASE_SCRIPT)
+            elif self.cache.get(self.key) == self.token:
+                self.cache.delete(self.key)
+        self.acquired = False
+
+    def extend(self):
+        """
+        Reset the lock expiry if it is still held by this holder
+
+        Returns:
+            True when the lease was extended, False when it was lost
+        """
+        if self.atomic:
+            extended = bool(self.run_script(EXTEND_SCRIPT, int(self.timeout * 1000)))
+        else:
+            extended = self.cache.get(self.key) == self.token and self.cache.touch(self.key, self.timeout)
+        if not extended:
+            logger.warning(f"Lease {self.key} was lost before it could be extended")
+            self.acquired = False
+        return extended
+
+    def start_heartbeat(self):
+        self._stop_heartbeat.clear()
+
+        def beat():
+            while not self._stop_heartbeat.wait(self.heartbeat_interval):
+                if not self.extend():
+                    return
+
+        self._heartbeat_thread = threading.Thread(target=beat, daemon=True)
+        self._heartbeat_thread.start()
+
+    def stop_heartbeat(self):
+        self._stop_heartbeat.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+
+    def is_locked(self):
+        return self.cache.get(self.key) is not None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
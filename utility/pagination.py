@@ -1,10 +1,220 @@
-from rest_framework.pagination import PageNumberPagination
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from utility.counts import CountStrategy
+
+
+class EstimatedPage(Page):
+    """
+    Page of a paginator whose count is a planner estimate.
+
+    Whether a next page exists is known from one extra row fetched with the
+    page, not from the estimated count, and neither page number is checked
+    against it.
+    """
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+
+class CountedPaginator(Paginator):
+    """
+    Django paginator taking its count from a CountStrategy.
+
+    count_estimated tells whether the count is a planner estimate. Pages of an
+    estimated count are sliced directly instead of being checked against it.
+    """
+    count_estimated = False
+
+    def __init__(self, object_list, per_page, count_strategy=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy or CountStrategy()
+
+    @cached_property
+    def count(self):
+        count, self.count_estimated = self.count_strategy.count(self.object_list)
+        return count
+
+    def page(self, number):
+        if not self.count or not self.count_estimated:
+            return super().page(number)
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        return EstimatedPage(rows[:self.per_page], number, self, has_more=len(rows) > self.per_page)
 
 
 class Pagination(PageNumberPagination):
     """
     Standard pagination settings for API views.
+
+    Counts come from CountStrategy: cached exact counts, or planner estimates
+    for large results, flagged by count_estimated in the response.
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    django_paginator_class = CountedPaginator
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.page.paginator.count,
+            'count_estimated': self.page.paginator.count_estimated,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_estimated'] = {
+            'type': 'boolean',
+            'example': False,
+        }
+        return response_schema
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on (created_at, id), newest first.
+
+    The cursor holds the whole (created_at, id) key of the row it stops at, and
+    pages are read with WHERE (created_at, id) < cursor ORDER BY created_at
+    DESC, id DESC LIMIT n, served by a composite index, so a page costs the
+    same at any depth, even across rows created in the same instant. There is
+    no COUNT(*) and no OFFSET scan; the response carries next and previous
+    cursors instead of a total count.
     """
+    ordering = ('-created_at', '-id')
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
+    # Joins the ordering values of a row into its cursor position
+    position_separator = '|'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        current_position = self.cursor.position if self.cursor is not None else None
+
+        if reverse:
+            queryset = queryset.order_by(*(
+                order[1:] if order.startswith('-') else f"-{order}" for order in self.ordering
+            ))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            # Rows after the cursor in the direction read: (created_at, id) < or > the cursor key
+            descending = self.ordering[0].startswith('-')
+            lookup = 'lt' if reverse != descending else 'gt'
+            queryset = queryset.filter(self.keyset_filter(queryset.model, current_position, lookup))
+
+        # One extra row tells whether a following page exists
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following_position = len(results) > len(self.page)
+        following_position = None
+        if has_following_position:
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None
+            self.has_previous = has_following_position
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def decode_cursor(self, request):
+        # Positions are unique, so a cursor never carries DRF's offset for ties
+        cursor = super().decode_cursor(request)
+        if cursor is None:
+            return None
+        return cursor._replace(offset=0)
+
+    def keyset_filter(self, model, position, lookup):
+        """
+        Build the row comparison (field_1, ..., field_n) < or > position as a Q
+
+        The comparison is expanded into field_1 < v_1 OR (field_1 = v_1 AND
+        field_2 < v_2) ..., with a leading field_1 <= v_1 bound so the database
+        reads a single range of the composite index.
+
+        Args:
+            model: Model of the paginated queryset
+            position: Position string of the cursor
+            lookup: 'lt' or 'gt'
+
+        Returns:
+            Q: Filter keeping the rows past the position
+
+        Raises:
+            NotFound: If the position does not hold a valid key
+        """
+        names = [order.lstrip('-') for order in self.ordering]
+        raw_values = position.split(self.position_separator)
+        if len(raw_values) != len(names):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            values = [
+                model._meta.get_field(name).to_python(raw_value)
+                for name, raw_value in zip(names, raw_values)
+            ]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+        row_comparison = Q()
+        for index, name in enumerate(names):
+            equal_prefix = {prefix: value for prefix, value in zip(names[:index], values)}
+            row_comparison |= Q(**equal_prefix, **{f"{name}__{lookup}": values[index]})
+        return Q(**{f"{names[0]}__{lookup}e": values[0]}) & row_comparison
+
+    def _get_position_from_instance(self, instance, ordering):
+        names = [order.lstrip('-') for order in ordering]
+        if isinstance(instance, dict):
+            values = [instance[name] for name in names]
+        else:
+            values = [getattr(instance, name) for name in names]
+        return self.position_separator.join(
+            value.isoformat() if hasattr(value, 'isoformat') else str(value) for value in values
+        )
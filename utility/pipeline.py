@@ -0,0 +1,162 @@
+import logging
+import queue
+import threading
+from collections import Counter
+from django.conf import settings
+from utility.scraper import fetch_article_html, parse_article_html
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input
+DONE = object()
+
+
+def normalize_article(news_item):
+    """
+    Validate an extracted article before it is persisted
+
+    Args:
+        news_item: ScrapedArticle from parse_article_html
+
+    Returns:
+        The article, or None when it has no source or title
+    """
+    if news_item is None or not news_item.source or not news_item.title:
+        return None
+    return news_item
+
+
+class StreamingPipeline:
+    """
+    Fetch -> extract -> normalize -> persist pipeline connected by bounded queues.
+
+    Fetch workers download pages, one thread extracts and normalizes them, and
+    the calling thread persists them in batches, so database writes stay on the
+    caller's connection. Every queue holds at most queue_size items: when the
+    database is slow the queues fill up and fetching blocks, so memory stays
+    constant however many URLs are crawled. A failing article is dropped
+    without stopping the stream.
+
+    It backs scrape_news_task, which beat only runs with SCRAPER_PIPELINE =
+    'task'. The default canvas path spreads the same stages over Celery tasks
+    and persists each run's articles together in its chord callback.
+    """
+
+    def __init__(self, persist, fetch=fetch_article_html, extract=parse_article_html, normalize=normalize_article,
+                 fetch_workers=None, queue_size=None, batch_size=None):
+        self.persist = persist
+        self.fetch = fetch
+        self.extract = extract
+        self.normalize = normalize
+        self.fetch_workers = fetch_workers or getattr(settings, 'SCRAPER_MAX_WORKERS', 8)
+        self.queue_size = queue_size or getattr(settings, 'SCRAPER_PIPELINE_QUEUE_SIZE', 32)
+        self.batch_size = batch_size or getattr(settings, 'SCRAPER_PIPELINE_BATCH_SIZE', 50)
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def count(self, name, amount=1):
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def run(self, urls):
+        """
+        Stream the given article URLs into the persist callable
+
+        Args:
+            urls: Iterable of article URLs, consumed lazily
+
+        Returns:
+            Counter with the fetched, extracted, failed and persisted totals,
+            plus the sums of the dictionaries returned by persist
+        """
+        url_queue = queue.Queue(self.queue_size)
+        page_queue = queue.Queue(self.queue_size)
+        item_queue = queue.Queue(self.queue_size)
+
+        threads = [threading.Thread(target=self.feed, args=(urls, url_queue), daemon=True)]
+        threads += [
+            threading.Thread(target=self.fetch_stage, args=(url_queue, page_queue), daemon=True)
+            for _ in range(self.fetch_workers)
+        ]
+        threads.append(threading.Thread(target=self.extract_stage, args=(page_queue, item_queue), daemon=True))
+        for thread in threads:
+            thread.start()
+
+        self.persist_stage(item_queue)
+
+        for thread in threads:
+            thread.join()
+        logger.info(f"Pipeline finished: {dict(self.stats)}")
+        return self.stats
+
+    def feed(self, urls, url_queue):
+        try:
+            for url in urls:
+                url_queue.put(url)
+        finally:
+            for _ in range(self.fetch_workers):
+                url_queue.put(DONE)
+
+    def fetch_stage(self, url_queue, page_queue):
+        try:
+            while True:
+                url = url_queue.get()
+                if url is DONE:
+                    return
+                try:
+                    html_content = self.fetch(url)
+                except Exception as e:
+                    logger.error(f"Error fetching article {url}: {e}")
+                    html_content = None
+                if html_content is None:
+                    self.count('failed')
+                    continue
+                self.count('fetched')
+                page_queue.put((url, html_content))
+        finally:
+            page_queue.put(DONE)
+
+    def extract_stage(self, page_queue, item_queue):
+        remaining = self.fetch_workers
+        try:
+            while remaining:
+                page = page_queue.get()
+                if page is DONE:
+                    remaining -= 1
+                    continue
+                url, html_content = page
+                try:
+                    news_item = self.normalize(self.extract(html_content, url))
+                except Exception as e:
+                    logger.error(f"Error extracting article {url}: {e}")
+                    news_item = None
+                if news_item is None:
+                    self.count('failed')
+                    continue
+                self.count('extracted')
+                item_queue.put(news_item)
+        finally:
+            item_queue.put(DONE)
+
+    def persist_stage(self, item_queue):
+        batch = []
+        while True:
+            news_item = item_queue.get()
+            if news_item is not DONE:
+                batch.append(news_item)
+            if batch and (news_item is DONE or len(batch) >= self.batch_size):
+                self.flush(batch)
+                batch = []
+            if news_item is DONE:
+                return
+
+    def flush(self, batch):
+        try:
+            result = self.persist(batch)
+        except Exception as e:
+            logger.error(f"Error persisting {len(batch)} articles: {e}")
+            self.count('failed', len(batch))
+            return
+        self.count('persisted', len(batch))
+        for name, value in (result or {}).items():
+            self.count(name, value)
@@ -0,0 +1,27 @@
+import json
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON: one JSON document per line.
+
+    Lists and the results of a paginated response are rendered one item per
+    line. Views streaming their output use render_line for each item.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    @staticmethod
+    def render_line(item):
+        return json.dumps(item, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, dict) and isinstance(data.get('results'), list):
+            data = data['results']
+        items = data if isinstance(data, list) else [data]
+        return ''.join(self.render_line(item) for item in items).encode(self.charset)
@@ -0,0 +1,208 @@
+import logging
+import threading
+import time
+from django.conf import settings
+from django.core.cache import caches
+from utility import http_client
+from utility.http_client import CircuitOpenError
+from utility.scraper import scrape_digiato_news, iter_digiato_news, build_listing_url
+from utility.single_flight import scrape_single_flight, SingleFlightTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeCache:
+    """
+    TTL cache with stale-while-revalidate around scrape_digiato_news.
+
+    Entries live in the Django cache so every gunicorn worker shares one copy.
+    A fresh entry is returned as is. A stale entry, one older than ttl but
+    younger than ttl + stale_ttl, is returned immediately while one background
+    refresh replaces it. Missing entries are scraped synchronously, once for all
+    concurrent requests of the same page.
+
+    The last good result of every page is also kept without expiry. While the
+    upstream circuit is open it is served, flagged as stale, instead of
+    waiting on a host that is known to be down.
+    """
+    # v2 entries hold ScrapedArticle records instead of dictionaries
+    key_prefix = 'scrape:result:v2:'
+    refresh_key_prefix = 'scrape:refreshing:'
+    last_good_key_prefix = 'scrape:last-good:v2:'
+
+    def __init__(self, ttl=None, stale_ttl=None, cache_alias='default'):
+        self.cache = caches[cache_alias]
+        self.ttl = ttl if ttl is not None else getattr(settings, 'SCRAPER_CACHE_TTL', 300)
+        self.stale_ttl = stale_ttl if stale_ttl is not None else getattr(settings, 'SCRAPER_CACHE_STALE_TTL', 3600)
+
+    def make_key(self, page_number, topic):
+        return f"{self.key_prefix}{topic}:{page_number}"
+
+    def make_last_good_key(self, page_number, topic):
+        return f"{self.last_good_key_prefix}{topic}:{page_number}"
+
+    def get_result(self, page_number=1, topic="tech", deadline=None):
+        """
+        Return the scraped news of a listing page with its freshness
+
+        Args:
+            page_number: Page number to scrape (default: 1)
+            topic: Topic to scrape (default: "tech")
+            deadline: Optional Deadline bounding a scrape on cache miss
+
+        Returns:
+            Dictionary with 'items', 'stale' (served from the last good result
+            because the upstream is unavailable), 'fetched_at', 'partial' (the
+            deadline expired before every article was fetched, or before a
+            scrape running elsewhere finished) and 'skipped_urls'
+
+        Raises:
+            CircuitOpenError: The upstream circuit is open and the page was never scraped
+        """
+        entry = self.cache.get(self.make_key(page_number, topic))
+        upstream_down = http_client.circuit_is_open(build_listing_url(page_number, topic))
+
+        if entry is not None:
+            age = time.time() - entry['fetched_at']
+            if age >= self.ttl and not upstream_down:
+                logger.info(f"Serving stale scrape result for {topic}/{page_number} ({age:.0f}s old)")
+                self.refresh_in_background(page_number, topic)
+            return self.make_result(entry['items'], entry['fetched_at'], stale=age >= self.ttl and upstream_down)
+
+        scrape_result = None
+        if not upstream_down:
+            try:
+                scrape_result = scrape_single_flight.do(
+                    self.make_key(page_number, topic),
+                    lambda: self.scrape_result(page_number, topic, deadline),
+                    load=lambda: self.cached_result(page_number, topic),
+                    deadline=deadline,
+                )
+            except SingleFlightTimeout as e:
+                logger.warning(f"{e}, falling back to the last good result")
+                # The page was not read in time, whatever the fallback holds
+                listing_url = build_listing_url(page_number, topic)
+                if deadline is not None:
+                    deadline.skip([listing_url])
+                result = self.last_good_result(page_number, topic)
+                result.update(partial=True, skipped_urls=[listing_url])
+                return result
+            else:
+                if scrape_result['items']:
+                    return scrape_result
+
+        return self.last_good_result(page_number, topic, fallback=scrape_result)
+
+    @staticmethod
+    def make_result(news_items, fetched_at, stale=False, skipped_urls=None):
+        return {
+            'items': news_items,
+            'stale': stale,
+            'fetched_at': fetched_at,
+            'partial': bool(skipped_urls),
+            'skipped_urls': list(skipped_urls or []),
+        }
+
+    def scrape_result(self, page_number, topic, deadline=None):
+        news_items = self.refresh(page_number, topic, deadline=deadline)
+        return self.make_result(news_items, time.time(), skipped_urls=deadline.skipped if deadline else None)
+
+    def cached_result(self, page_number, topic):
+        entry = self.cache.get(self.make_key(page_number, topic))
+        return self.make_result(entry['items'], entry['fetched_at']) if entry is not None else None
+
+    def stream(self, page_number=1, topic="tech", deadline=None):
+        """
+        Return an iterator over the news items of a listing page
+
+        Cached pages, fresh or stale, are served like get_result. An uncached page
+        is scraped live and its items are yielded as soon as they are extracted,
+        then stored once the stream is exhausted, unless the deadline cut it short.
+
+        Raises:
+            CircuitOpenError: The upstream circuit is open and the page was never scraped
+        """
+        entry = self.cache.get(self.make_key(page_number, topic))
+        if entry is not None or http_client.circuit_is_open(build_listing_url(page_number, topic)):
+            return iter(self.get_result(page_number, topic)['items'])
+        return self.stream_and_store(page_number, topic, deadline)
+
+    def stream_and_store(self, page_number, topic, deadline=None):
+        news_items = []
+        for news_item in iter_digiato_news(page_number=page_number, topic=topic, deadline=deadline):
+            news_items.append(news_item)
+            yield news_item
+        if deadline is None or not deadline.partial:
+            self.set(page_number, topic, news_items)
+
+    def last_good_result(self, page_number, topic, fallback=None):
+        """
+        Fall back to the last good result of a page when a scrape yields nothing
+        """
+        entry = self.cache.get(self.make_last_good_key(page_number, topic))
+        if entry is None:
+            if http_client.circuit_is_open(build_listing_url(page_number, topic)):
+                raise CircuitOpenError(f"Upstream unavailable and no cached result for {topic}/{page_number}")
+            return fallback or self.make_result([], None)
+
+        logger.warning(f"Serving last good scrape result for {topic}/{page_number} (upstream unavailable)")
+        return self.make_result(entry['items'], entry['fetched_at'], stale=True)
+
+    def refresh(self, page_number=1, topic="tech", deadline=None):
+        """
+        Scrape a listing page and store the result
+
+        A result cut short by the deadline is returned but not stored, so it
+        is never served as the complete page.
+
+        Returns:
+            List of news items
+        """
+        news_items = scrape_digiato_news(page_number=page_number, topic=topic, deadline=deadline)
+        if deadline is None or not deadline.partial:
+            self.set(page_number, topic, news_items)
+        return news_items
+
+    def set(self, page_number, topic, news_items):
+        # An empty result usually means the upstream failed, keep serving the previous one
+        if news_items:
+            entry = {'items': news_items, 'fetched_at': time.time()}
+            self.cache.set(self.make_key(page_number, topic), entry, self.ttl + self.stale_ttl)
+            self.cache.set(self.make_last_good_key(page_number, topic), entry, None)
+
+    def refresh_in_background(self, page_number, topic):
+        """
+        Start one background refresh across all workers
+
+        Returns:
+            The refresh thread, or None when another refresh is already running
+        """
+        refresh_key = f"{self.refresh_key_prefix}{topic}:{page_number}"
+        if not self.cache.add(refresh_key, 1, getattr(settings, 'SCRAPER_TIMEOUT', 10) * 6):
+            return None
+
+        def run():
+            try:
+                self.refresh(page_number, topic)
+            except Exception as e:
+                logger.error(f"Background scrape refresh failed for {topic}/{page_number}: {e}")
+            finally:
+                self.cache.delete(refresh_key)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+
+def cached_scrape_result(page_number=1, topic="tech", deadline=None):
+    """
+    Scrape result with its staleness flag, served through the shared scrape cache
+    """
+    return ScrapeCache().get_result(page_number=page_number, topic=topic, deadline=deadline)
+
+
+def cached_scrape_stream(page_number=1, topic="tech", deadline=None):
+    """
+    Iterator over a page's news items, streamed live when nothing is cached
+    """
+    return ScrapeCache().stream(page_number=page_number, topic=topic, deadline=deadline)
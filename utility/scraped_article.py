@@ -0,0 +1,67 @@
+import hashlib
+from uuid import uuid4
+from django.utils import timezone
+
+# Separates the title from the text in normalized_text, so no keyword spans both
+FIELD_SEPARATOR = '\x00'
+
+
+def compute_content_hash(title, text):
+    """
+    Hash of the article content used to detect unchanged articles
+
+    Args:
+        title: Article title
+        text: Article full text
+
+    Returns:
+        Hex sha256 digest
+    """
+    return hashlib.sha256(f"{title}\n{text}".encode('utf-8')).hexdigest()
+
+
+class ScrapedArticle:
+    """
+    One article extracted by the scraper.
+
+    A slotted record rather than a dictionary: scrape batches hold thousands of
+    them, and the lowercased search text and the content hash are computed once
+    here instead of in every keyword filter and ingest pass. as_dict gives the
+    public fields for API responses and task messages, from_dict rebuilds the
+    record from them.
+    """
+    __slots__ = ('id', 'title', 'text', 'source', 'published_at', 'tags', 'normalized_text', 'content_hash')
+
+    def __init__(self, title, text, source, tags=None, published_at=None, id=None):
+        self.id = id or str(uuid4())
+        self.title = title
+        self.text = text
+        self.source = source
+        self.published_at = published_at or timezone.now()
+        self.tags = list(tags or [])
+        self.normalized_text = f"{title}{FIELD_SEPARATOR}{text}".lower()
+        self.content_hash = compute_content_hash(title, text)
+
+    def __repr__(self):
+        return f"ScrapedArticle(source={self.source!r}, title={self.title!r})"
+
+    def as_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'text': self.text,
+            'source': self.source,
+            'published_at': self.published_at,
+            'tags': self.tags,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            title=data['title'],
+            text=data['text'],
+            source=data['source'],
+            tags=data.get('tags'),
+            published_at=data.get('published_at'),
+            id=data.get('id'),
+        )
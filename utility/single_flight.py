@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+from django.conf import settings
+from utility.locks import CacheLock
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlightTimeout(TimeoutError):
+    """
+    Raised to a waiting caller when the in-flight call outlives the timeout
+    """
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    Inside a process, callers that arrive while a call is in flight wait for it
+    and share its result. Across workers, the in-process leader also takes a
+    CacheLock. Leaders in other workers wait for that lock to be released and
+    then read the result the winner stored, through the load callable.
+    """
+
+    def __init__(self, timeout=None, poll_interval=0.1):
+        self.timeout = timeout or getattr(settings, 'SCRAPER_SINGLE_FLIGHT_TIMEOUT', 120)
+        self.poll_interval = poll_interval
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def wait_timeout(self, deadline=None):
+        """
+        Seconds a caller may wait for another caller's call, capped by its deadline
+        """
+        if deadline is None:
+            return self.timeout
+        return min(self.timeout, deadline.remaining())
+
+    def do(self, key, func, load=None, deadline=None):
+        """
+        Run func once for all concurrent callers of key
+
+        Args:
+            key: Identity of the call (e.g. the scrape parameters)
+            func: Callable producing the result
+            load: Callable reading the result another worker stored, None when missing
+            deadline: Optional Deadline of the caller, capping its wait for another caller
+
+        Returns:
+            Result of func, shared by every waiting caller
+
+        Raises:
+            SingleFlightTimeout: The in-flight call did not finish within the
+                timeout or the caller's deadline
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            wait_timeout = self.wait_timeout(deadline)
+            if not call.done.wait(wait_timeout):
+                raise SingleFlightTimeout(f"Timed out after {wait_timeout:.2f}s waiting for {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run_across_workers(key, func, load, deadline)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.result
+
+    def _run_across_workers(self, key, func, load, deadline=None):
+        lock = CacheLock(f"single-flight:{key}", timeout=self.timeout)
+        if lock.acquire():
+            try:
+                return func()
+            finally:
+                lock.release()
+
+        logger.info(f"Waiting for another worker to finish {key}")
+        wait_timeout = self.wait_timeout(deadline)
+        wait_until = time.monotonic() + wait_timeout
+        while lock.is_locked() and time.monotonic() < wait_until:
+            time.sleep(min(self.poll_interval, max(wait_until - time.monotonic(), 0)))
+
+        if deadline is not None and deadline.expired() and lock.is_locked():
+            # Running func now would outlast the caller's deadline
+            raise SingleFlightTimeout(f"Timed out after {wait_timeout:.2f}s waiting for another worker on {key}")
+
+        result = load() if load else None
+        if result is None:
+            result = func()
+        return result
+
+
+scrape_single_flight = SingleFlight()
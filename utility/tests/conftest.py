@@ -0,0 +1,8 @@
+import pytest
+from .stand_in_site import StandInSite
+
+
+@pytest.fixture
+def stand_in_site():
+    with StandInSite() as site:
+        yield site
@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInSite:
+    """
+    Local stand-in for the Digiato website used by tests and benchmarks.
+
+    Serves topic listing pages with a JSON-LD ItemList and article pages with
+    the same markup the scraper looks for. Every request is counted per path so
+    tests can assert how many upstream fetches really happened.
+    """
+
+    def __init__(self, articles_per_page=20, pages=3, article_delay=0.0, listing_delay=0.0):
+        self.articles_per_page = articles_per_page
+        self.pages = pages
+        self.article_delay = article_delay
+        self.listing_delay = listing_delay
+        self.hits = Counter()
+        self.faults = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listing_url(self, page_number=1, topic="tech"):
+        return f"{self.base_url}/topic/{topic}/page/{page_number}"
+
+    def article_url(self, page_number, index):
+        return f"{self.base_url}/article-{page_number}-{index}"
+
+    def article_urls(self, page_number=1):
+        return [self.article_url(page_number, i) for i in range(self.articles_per_page)]
+
+    def article_hits(self):
+        with self._lock:
+            return {path: count for path, count in self.hits.items() if path.startswith('/article-')}
+
+    def inject_faults(self, path, statuses, retry_after=None):
+        """
+        Answer the next requests for path with the given error statuses
+        """
+        with self._lock:
+            self.faults[path] = [(status, retry_after) for status in statuses]
+
+    def next_fault(self, path):
+        with self._lock:
+            queued = self.faults.get(path)
+            if queued:
+                return queued.pop(0)
+        return None
+
+    def start(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with site._lock:
+                    site.hits[self.path] += 1
+                headers = {}
+                fault = site.next_fault(self.path)
+                if fault:
+                    status, retry_after = fault
+                    body = '<html><body>Try again later</body></html>'
+                    if retry_after is not None:
+                        headers['Retry-After'] = str(retry_after)
+                else:
+                    status, body = site.respond(self.path)
+                payload = body.encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def respond(self, path):
+        parts = path.strip('/').split('/')
+
+        if len(parts) == 4 and parts[0] == 'topic' and parts[2] == 'page':
+            time.sleep(self.listing_delay)
+            page_number = int(parts[3])
+            if page_number > self.pages:
+                return 404, '<html><body>Not Found</body></html>'
+            return 200, self.render_listing(page_number)
+
+        if len(parts) == 1 and parts[0].startswith('article-'):
+            time.sleep(self.article_delay)
+            _, page_number, index = parts[0].split('-')
+            return 200, self.render_article(int(page_number), int(index))
+
+        return 404, '<html><body>Not Found</body></html>'
+
+    def render_listing(self, page_number):
+        item_list = {
+            '@context': 'https://schema.org',
+            '@type': 'ItemList',
+            'itemListElement': [
+                {'@type': 'ListItem', 'position': i + 1, 'url': url}
+                for i, url in enumerate(self.article_urls(page_number))
+            ],
+        }
+        boxes = ''.join(
+            f'<article class="b-post-box"><a class="b-post-box__link" href="{url}">'
+            f'<h3 class="b-post-box__title">خبر شماره {i}</h3></a></article>'
+            for i, url in enumerate(self.article_urls(page_number))
+        )
+        return (
+            '<html><head>'
+            f'<script type="application/ld+json">{json.dumps(item_list)}</script>'
+            '</head><body>'
+            f'<div class="b-archive-posts">{boxes}</div>'
+            '</body></html>'
+        )
+
+    def render_article(self, page_number, index):
+        paragraphs = ''.join(
+            f'<p>پاراگراف {n} از خبر {page_number}-{index} درباره فناوری و هوش مصنوعی است.</p>'
+            for n in range(5)
+        )
+        return (
+            '<html><body><article>'
+            f'<h1 class="b-post__title">عنوان خبر {page_number}-{index}</h1>'
+            '<span class="b-post__time">۱۴۰۴/۰۲/۱۸</span>'
+            f'<div class="b-content">{paragraphs}</div>'
+            '<div class="b-post__tags"><a href="/tag/tech">فناوری</a><a href="/tag/ai">هوش مصنوعی</a></div>'
+            '</article></body></html>'
+        )
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+from utility.deadline import Deadline
+from utility.http_client import HttpClient, RetryPolicy, CircuitBreaker, CircuitOpenError, DeadlineExceeded
+
+
+@pytest.fixture
+def client():
+    return HttpClient(retry_policy=RetryPolicy(max_retries=0))
+
+
+def open_circuit(client, site, path='/article-1-0'):
+    breaker = client.breaker_for(site.base_url)
+    breaker.failure_threshold = 2
+    breaker.reset_timeout = 0.2
+    site.inject_faults(path, [503, 503])
+    for _ in range(2):
+        client.get(f"{site.base_url}{path}")
+    return breaker
+
+
+class TestCircuitBreaker:
+
+    def test_circuit_opens_after_consecutive_failures(self, stand_in_site, client):
+        # arrange
+        breaker = open_circuit(client, stand_in_site)
+
+        # act
+        with pytest.raises(CircuitOpenError):
+            client.get(stand_in_site.article_url(1, 1))
+
+        # assert
+        assert breaker.state == CircuitBreaker.OPEN
+        assert stand_in_site.hits['/article-1-1'] == 0
+        assert client.retry_stats()[stand_in_site.base_url.split('://')[1]]['rejected'] == 1
+
+    def test_successful_probe_closes_circuit(self, stand_in_site, client):
+        # arrange
+        breaker = open_circuit(client, stand_in_site)
+        time.sleep(0.25)
+
+        # act
+        state_before_probe = breaker.state
+        response = client.get(stand_in_site.article_url(1, 1))
+
+        # assert
+        assert state_before_probe == CircuitBreaker.HALF_OPEN
+        assert response.status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens_circuit(self, stand_in_site, client):
+        # arrange
+        breaker = open_circuit(client, stand_in_site)
+        time.sleep(0.25)
+        stand_in_site.inject_faults('/article-1-1', [503])
+
+        # act
+        client.get(stand_in_site.article_url(1, 1))
+
+        # assert
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_probe_cut_short_by_the_deadline_is_given_back(self, stand_in_site, client):
+        # arrange
+        breaker = open_circuit(client, stand_in_site)
+        time.sleep(0.25)
+        with pytest.raises(DeadlineExceeded):
+            client.get(stand_in_site.article_url(1, 1), deadline=Deadline(0))
+
+        # act
+        state_after_deadline = breaker.state
+        response = client.get(stand_in_site.article_url(1, 1))
+
+        # assert
+        assert state_after_deadline == CircuitBreaker.HALF_OPEN
+        assert response.status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_admits_limited_probes(self):
+        # arrange
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, half_open_probes=1)
+        breaker.record_failure()
+
+        # act
+        admitted = [breaker.allow() for _ in range(3)]
+
+        # assert
+        assert admitted == [True, False, False]
@@ -0,0 +1,29 @@
+from utility.scraper import discover_article_urls
+
+
+class TestDiscoverArticleUrls:
+
+    def test_only_unknown_articles_are_kept(self, stand_in_site, settings):
+        # arrange
+        settings.SCRAPER_BASE_URL = stand_in_site.base_url
+        new_urls = stand_in_site.article_urls(1)[:3]
+
+        # act
+        urls = discover_article_urls(url_filter=lambda urls: [url for url in urls if url in new_urls])
+
+        # assert
+        assert urls == new_urls
+        assert sum(stand_in_site.article_hits().values()) == 0
+
+    def test_paging_stops_at_fully_known_page(self, stand_in_site, settings):
+        # arrange
+        settings.SCRAPER_BASE_URL = stand_in_site.base_url
+        new_urls = set(stand_in_site.article_urls(1))
+
+        # act
+        discover_article_urls(url_filter=lambda urls: [url for url in urls if url in new_urls], max_pages=3)
+
+        # assert
+        assert stand_in_site.hits['/topic/tech/page/1'] == 1
+        assert stand_in_site.hits['/topic/tech/page/2'] == 1
+        assert stand_in_site.hits['/topic/tech/page/3'] == 0
@@ -0,0 +1,42 @@
+from utility import scraper
+from utility.scraper import extract_listing
+
+LISTING_WITH_JSONLD = '''
+<html><head><script type="application/ld+json">
+{"@type": "ItemList", "itemListElement": [
+    {"@type": "ListItem", "url": "https://digiato.com/a"},
+    {"@type": "ListItem", "url": "https://digiato.com/b"}
+]}
+</script></head><body><div class="b-archive-posts"></div></body></html>
+'''
+
+LISTING_WITHOUT_JSONLD = '''
+<html><body><div class="b-archive-posts">
+<article><a class="b-post-box__link" href="/a"><h3 class="b-post-box__title">خبر اول</h3></a></article>
+<article><a class="b-post-box__link" href="https://digiato.com/b"><h3 class="b-post-box__title">خبر دوم</h3></a></article>
+</div></body></html>
+'''
+
+
+class TestExtractListing:
+
+    def test_jsonld_urls_are_read_without_full_parse(self, monkeypatch):
+        # arrange
+        full_parses = []
+        monkeypatch.setattr(scraper, 'extract_article_links_from_html', full_parses.append)
+
+        # act
+        article_urls, html_links = extract_listing(LISTING_WITH_JSONLD)
+
+        # assert
+        assert article_urls == ['https://digiato.com/a', 'https://digiato.com/b']
+        assert html_links == []
+        assert full_parses == []
+
+    def test_falls_back_to_html_post_boxes(self):
+        # act
+        article_urls, html_links = extract_listing(LISTING_WITHOUT_JSONLD)
+
+        # assert
+        assert article_urls == []
+        assert html_links == [('https://digiato.com/a', 'خبر اول'), ('https://digiato.com/b', 'خبر دوم')]
@@ -0,0 +1,106 @@
+import time
+from utility.deadline import Deadline
+from utility.scraper import fetch_articles_details, fetch_articles_from_links, scrape_digiato_news
+
+
+class TestFetchArticlesDetails:
+
+    def test_results_keep_listing_order(self, stand_in_site):
+        # arrange
+        urls = stand_in_site.article_urls()
+
+        # act
+        news_items = fetch_articles_details(urls, max_workers=8)
+
+        # assert
+        assert [item.source for item in news_items] == urls
+        assert news_items[0].title == 'عنوان خبر 1-0'
+
+    def test_failing_article_is_isolated(self, stand_in_site):
+        # arrange
+        urls = stand_in_site.article_urls()[:3]
+        urls.insert(1, f"{stand_in_site.base_url}/missing")
+
+        # act
+        news_items = fetch_articles_details(urls, max_workers=4)
+
+        # assert
+        assert [item.source for item in news_items] == [urls[0], urls[2], urls[3]]
+
+    def test_concurrent_fetch_is_faster_than_sequential(self, stand_in_site):
+        # arrange
+        stand_in_site.article_delay = 0.2
+        urls = stand_in_site.article_urls()[:8]
+
+        # act
+        started = time.perf_counter()
+        news_items = fetch_articles_details(urls, max_workers=8)
+        elapsed = time.perf_counter() - started
+
+        # assert
+        assert len(news_items) == 8
+        assert elapsed < 8 * 0.2
+
+    def test_deadline_skips_unfinished_articles(self, stand_in_site):
+        # arrange
+        stand_in_site.article_delay = 0.3
+        urls = stand_in_site.article_urls()[:6]
+        deadline = Deadline(0.45)
+
+        # act
+        started = time.perf_counter()
+        news_items = fetch_articles_details(urls, max_workers=3, deadline=deadline)
+        elapsed = time.perf_counter() - started
+
+        # assert
+        assert [item.source for item in news_items] == urls[:3]
+        assert deadline.skipped == urls[3:]
+        assert elapsed < 0.6
+
+
+class TestFetchArticlesFromLinks:
+
+    def test_failed_links_are_left_out(self, stand_in_site):
+        # arrange
+        links = [(url, f'خبر {i}') for i, url in enumerate(stand_in_site.article_urls()[:3])]
+        links.insert(1, (f"{stand_in_site.base_url}/missing", 'خبر حذف شده'))
+
+        # act
+        news_items = fetch_articles_from_links(links, max_workers=4)
+
+        # assert
+        assert [item.source for item in news_items] == [links[0][0], links[2][0], links[3][0]]
+        assert news_items[0].title == 'خبر 0'
+
+    def test_deadline_skips_unfinished_links(self, stand_in_site):
+        # arrange
+        stand_in_site.article_delay = 0.3
+        links = [(url, f'خبر {i}') for i, url in enumerate(stand_in_site.article_urls()[:6])]
+        deadline = Deadline(0.45)
+
+        # act
+        news_items = fetch_articles_from_links(links, max_workers=3, deadline=deadline)
+
+        # assert
+        assert [item.source for item in news_items] == [url for url, _ in links[:3]]
+        assert deadline.skipped == [url for url, _ in links[3:]]
+
+
+class TestScrapeDeadline:
+
+    def test_listing_retries_stop_at_the_deadline(self, stand_in_site, settings):
+        # arrange
+        settings.SCRAPER_BASE_URL = stand_in_site.base_url
+        stand_in_site.inject_faults('/topic/tech/page/1', [503, 503, 503, 503], retry_after=5)
+        deadline = Deadline(1)
+
+        # act
+        started = time.perf_counter()
+        news_items = scrape_digiato_news(deadline=deadline)
+        elapsed = time.perf_counter() - started
+
+        # assert
+        assert news_items == []
+        assert deadline.partial is True
+        assert deadline.skipped == [stand_in_site.listing_url()]
+        assert elapsed < 1
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+import pytest
+from utility.html_parsers import PARSER_BACKENDS, get_parser_backend
+from utility.scraper import parse_article_html, extract_listing
+from .test_extract_listing import LISTING_WITH_JSONLD, LISTING_WITHOUT_JSONLD
+
+PAGES_DIR = Path(__file__).parent / 'pages'
+GOLDEN = json.loads((PAGES_DIR / 'golden.json').read_text(encoding='utf-8'))
+
+
+@pytest.mark.parametrize('backend', sorted(PARSER_BACKENDS))
+@pytest.mark.parametrize('page', sorted(GOLDEN))
+def test_article_extraction_matches_golden_output(backend, page):
+    # arrange
+    html_content = (PAGES_DIR / page).read_text(encoding='utf-8')
+
+    # act
+    article_data = parse_article_html(html_content, f'https://digiato.com/{page}', parser=backend)
+
+    # assert
+    assert article_data.title == GOLDEN[page]['title']
+    assert article_data.text == GOLDEN[page]['text']
+    assert article_data.tags == GOLDEN[page]['tags']
+
+
+@pytest.mark.parametrize('backend', sorted(PARSER_BACKENDS))
+def test_listing_extraction_is_backend_independent(backend, settings):
+    # arrange
+    settings.SCRAPER_HTML_PARSER = backend
+
+    # act / assert
+    assert extract_listing(LISTING_WITH_JSONLD)[0] == ['https://digiato.com/a', 'https://digiato.com/b']
+    assert len(extract_listing(LISTING_WITHOUT_JSONLD)[1]) == 2
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        get_parser_backend('html5lib-fast')
+
+
+def test_html_parser_is_the_default_backend(settings):
+    # arrange
+    del settings.SCRAPER_HTML_PARSER
+
+    # act / assert
+    assert get_parser_backend().name == 'html.parser'
@@ -0,0 +1,51 @@
+from utility.http_client import HttpClient, DEFAULT_HEADERS
+from utility.scraper import fetch_articles_details
+
+
+class TestHttpClient:
+
+    def test_connections_are_reused_per_host(self, stand_in_site):
+        # arrange
+        client = HttpClient(pool_maxsize=2)
+        urls = stand_in_site.article_urls()[:5]
+
+        # act
+        for url in urls:
+            client.get(url).raise_for_status()
+        stats = client.connection_stats()
+
+        # assert
+        host = stand_in_site.base_url.split('://')[1]
+        assert stats[host]['requests'] == 5
+        assert stats[host]['connections'] == 1
+        assert stats[host]['reused'] == 4
+
+    def test_one_session_per_host_with_default_headers(self):
+        # arrange
+        client = HttpClient()
+
+        # act
+        first = client.session_for('https://digiato.com/topic/tech/page/1')
+        second = client.session_for('https://digiato.com/some-article')
+        other = client.session_for('https://example.com/')
+
+        # assert
+        assert first is second
+        assert first is not other
+        assert first.headers['User-Agent'] == DEFAULT_HEADERS['User-Agent']
+
+    def test_scraper_fetches_go_through_shared_pool(self, stand_in_site, monkeypatch):
+        # arrange
+        client = HttpClient(pool_maxsize=4)
+        monkeypatch.setattr('utility.http_client._default_client', client)
+        urls = stand_in_site.article_urls()[:8]
+
+        # act
+        news_items = fetch_articles_details(urls, max_workers=4)
+        stats = client.connection_stats()
+
+        # assert
+        host = stand_in_site.base_url.split('://')[1]
+        assert len(news_items) == 8
+        assert stats[host]['requests'] == 8
+        assert stats[host]['connections'] <= 4
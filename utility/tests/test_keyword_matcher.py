@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from django.http import QueryDict
+from utility import keyword_matcher
+from utility.keyword_matcher import KeywordMatcher
+from utility.scraped_article import ScrapedArticle
+
+
+def query(**params):
+    query_params = QueryDict(mutable=True)
+    query_params.update(params)
+    return query_params
+
+
+def naive_filter(news_items, required, any_of, excluded):
+    def contains(item, keyword):
+        return keyword in item.title.lower() or keyword in item.text.lower()
+
+    return [
+        item for item in news_items
+        if all(contains(item, k) for k in required) and
+        (not any_of or any(contains(item, k) for k in any_of)) and
+        not any(contains(item, k) for k in excluded)
+    ]
+
+
+ITEMS = [
+    ScrapedArticle(title='Apple unveils new chip', text='The M4 chip is faster.', source='https://digiato.com/1'),
+    ScrapedArticle(title='هوش مصنوعی', text='مدل‌های زبانی بزرگ', source='https://digiato.com/2'),
+    ScrapedArticle(title='Batteries', text='solid state, charging in minutes', source='https://digiato.com/3'),
+]
+
+
+class TestKeywordMatcher:
+
+    @pytest.mark.parametrize('params, expected', [
+        ({'keyword': 'CHIP'}, [0]),
+        ({'keywords': 'هوش, battery'}, [1]),
+        ({'keywords': 'solid,zzz'}, [2]),
+        ({'exclude_keyword': 'apple'}, [1, 2]),
+        ({'exclude_keywords': 'zzz,مدل'}, [0, 2]),
+        ({'keywords': 'app,apple'}, [0]),
+        ({'keywords': 'a,,b'}, [0, 1, 2]),
+        ({}, [0, 1, 2]),
+    ])
+    def test_filters(self, params, expected):
+        # act
+        news_items = KeywordMatcher.from_query_params(query(**params)).filter(ITEMS)
+
+        # assert
+        assert news_items == [ITEMS[index] for index in expected]
+
+    def test_overlapping_and_nested_keywords_are_all_found(self):
+        # arrange
+        matcher = KeywordMatcher(any_of=['abc', 'bcd', 'b', 'abcde'])
+
+        # act
+        found = matcher.found('xabcdex')
+
+        # assert
+        assert {'abc', 'bcd', 'b', 'abcde'} <= found
+
+    @pytest.mark.parametrize('substring_search_limit', [0, 128])
+    def test_matches_naive_substring_filters(self, monkeypatch, substring_search_limit):
+        # arrange
+        monkeypatch.setattr(keyword_matcher, 'SUBSTRING_SEARCH_LIMIT', substring_search_limit)
+        rng = random.Random(7)
+        alphabet = 'abcd'
+        news_items = [
+            ScrapedArticle(title=''.join(rng.choices(alphabet, k=8)), text=''.join(rng.choices(alphabet, k=40)),
+                           source=f'https://digiato.com/{i}')
+            for i in range(200)
+        ]
+
+        for _ in range(50):
+            required = [''.join(rng.choices(alphabet, k=rng.randint(1, 3)))]
+            any_of = [''.join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(4)]
+            excluded = [''.join(rng.choices(alphabet, k=rng.randint(3, 5))) for _ in range(3)]
+
+            # act
+            matcher = KeywordMatcher(required, any_of, excluded)
+            news_items_kept = matcher.filter(news_items)
+
+            # assert
+            assert matcher.substring_search is bool(substring_search_limit)
+            assert news_items_kept == naive_filter(news_items, required, any_of, excluded)
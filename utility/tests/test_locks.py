@@ -0,0 +1,118 @@
+import time
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django_redis.cache import RedisCache
+from utility.locks import CacheLock, EXTEND_SCRIPT, RELEASE_SCRIPT
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+class TestCacheLock:
+
+    def test_lock_is_exclusive(self):
+        # arrange
+        holder = CacheLock('job', timeout=5)
+        holder.acquire()
+
+        # act
+        acquired = CacheLock('job', timeout=5).acquire()
+
+        # assert
+        assert acquired is False
+
+    def test_heartbeat_keeps_lease_past_its_timeout(self):
+        # arrange
+        holder = CacheLock('job', timeout=0.6, heartbeat_interval=0.1)
+        holder.acquire()
+
+        # act
+        time.sleep(1.0)
+        acquired_by_other = CacheLock('job', timeout=5).acquire()
+        holder.release()
+
+        # assert
+        assert acquired_by_other is False
+        assert not holder.is_locked()
+
+    def test_lease_without_heartbeat_expires(self):
+        # arrange
+        CacheLock('job', timeout=0.3).acquire()
+
+        # act
+        time.sleep(0.4)
+        acquired = CacheLock('job', timeout=5).acquire()
+
+        # assert
+        assert acquired is True
+
+    def test_lost_lease_is_not_extended(self):
+        # arrange
+        holder = CacheLock('job', timeout=5)
+        holder.acquire()
+        cache.delete(holder.key)
+        CacheLock('job', timeout=5).acquire()
+
+        # act
+        extended = holder.extend()
+
+        # assert
+        assert extended is False
+        assert holder.acquired is False
+
+
+class TestRedisCacheLock:
+
+    @pytest.fixture
+    def redis_lock(self):
+        lock = CacheLock('job', timeout=5, token='holder-token')
+        lock.cache = RedisCache('redis://127.0.0.1:6379/0', {})
+        with mock.patch('utility.locks.get_redis_connection') as get_redis_connection:
+            yield lock, get_redis_connection.return_value
+
+    def test_release_compares_and_deletes_in_one_script(self, redis_lock):
+        # arrange
+        lock, connection = redis_lock
+
+        # act
+        lock.release()
+
+        # assert
+        connection.register_script.assert_called_once_with(RELEASE_SCRIPT)
+        connection.register_script.return_value.assert_called_once_with(
+            keys=[lock.cache.client.make_key('lock:job')],
+            args=[lock.cache.client.encode('holder-token')],
+        )
+        assert lock.acquired is False
+
+    def test_extend_compares_and_expires_in_one_script(self, redis_lock):
+        # arrange
+        lock, connection = redis_lock
+        connection.register_script.return_value.return_value = 1
+
+        # act
+        extended = lock.extend()
+
+        # assert
+        connection.register_script.assert_called_once_with(EXTEND_SCRIPT)
+        connection.register_script.return_value.assert_called_once_with(
+            keys=[lock.cache.client.make_key('lock:job')],
+            args=[lock.cache.client.encode('holder-token'), 5000],
+        )
+        assert extended is True
+
+    def test_extend_of_a_lease_held_by_another_fails(self, redis_lock):
+        # arrange
+        lock, connection = redis_lock
+        connection.register_script.return_value.return_value = 0
+
+        # act
+        extended = lock.extend()
+
+        # assert
+        assert extended is False
+        assert lock.acquired is False
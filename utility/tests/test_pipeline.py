@@ -0,0 +1,65 @@
+import threading
+import time
+
+from utility.pipeline import StreamingPipeline
+from utility.scraper import fetch_articles_details
+
+
+def without_volatile_fields(news_items):
+    return sorted(
+        ({key: value for key, value in item.as_dict().items() if key not in ('id', 'published_at')} for item in news_items),
+        key=lambda item: item['source'],
+    )
+
+
+class TestStreamingPipeline:
+
+    def test_output_matches_fetch_articles_details(self, stand_in_site):
+        # arrange
+        urls = stand_in_site.article_urls()
+        persisted = []
+
+        # act
+        stats = StreamingPipeline(persisted.extend, fetch_workers=4, batch_size=7).run(iter(urls))
+
+        # assert
+        assert without_volatile_fields(persisted) == without_volatile_fields(fetch_articles_details(urls))
+        assert stats['fetched'] == stats['extracted'] == stats['persisted'] == len(urls)
+
+    def test_failed_articles_are_dropped(self, stand_in_site):
+        # arrange
+        urls = stand_in_site.article_urls()[:5] + [f"{stand_in_site.base_url}/missing"]
+        persisted = []
+
+        # act
+        stats = StreamingPipeline(persisted.extend, fetch_workers=2).run(urls)
+
+        # assert
+        assert len(persisted) == 5
+        assert stats['failed'] == 1
+
+    def test_slow_persist_throttles_fetching(self):
+        # arrange
+        lock = threading.Lock()
+        progress = {'fetched': 0, 'persisted': 0, 'max_ahead': 0}
+
+        def fetch(url):
+            with lock:
+                progress['fetched'] += 1
+                progress['max_ahead'] = max(progress['max_ahead'], progress['fetched'] - progress['persisted'])
+            return f'<html><h1 class="b-post__title">{url}</h1></html>'
+
+        def persist(batch):
+            time.sleep(0.01)
+            with lock:
+                progress['persisted'] += len(batch)
+
+        pipeline = StreamingPipeline(persist, fetch=fetch, fetch_workers=2, queue_size=2, batch_size=1)
+
+        # act
+        stats = pipeline.run(f"https://digiato.com/{i}" for i in range(100))
+
+        # assert
+        assert stats['persisted'] == 100
+        # two bounded queues plus one item held by each stage
+        assert progress['max_ahead'] <= 2 * 2 + 2 + 1 + 1
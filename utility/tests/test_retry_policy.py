@@ -0,0 +1,132 @@
+import time
+
+import pytest
+from utility.deadline import Deadline
+from utility.http_client import DeadlineExceeded, HttpClient, RetryPolicy, TokenBucket
+
+
+@pytest.fixture
+def client():
+    return HttpClient(retry_policy=RetryPolicy(max_retries=2, backoff_base=0.01, backoff_max=2))
+
+
+def host_of(site):
+    return site.base_url.split('://')[1]
+
+
+class TestRetryPolicy:
+
+    def test_transient_503_is_retried(self, stand_in_site, client):
+        # arrange
+        url = stand_in_site.article_url(1, 0)
+        stand_in_site.inject_faults('/article-1-0', [503])
+
+        # act
+        response = client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert stand_in_site.hits['/article-1-0'] == 2
+        assert client.retry_stats()[host_of(stand_in_site)]['retries'] == 1
+
+    def test_retry_after_is_honored(self, stand_in_site, client):
+        # arrange
+        url = stand_in_site.article_url(1, 0)
+        stand_in_site.inject_faults('/article-1-0', [429], retry_after=1)
+
+        # act
+        started = time.monotonic()
+        response = client.get(url)
+        elapsed = time.monotonic() - started
+
+        # assert
+        assert response.status_code == 200
+        assert elapsed >= 0.9
+
+    def test_persistent_failure_is_dropped(self, stand_in_site, client):
+        # arrange
+        url = stand_in_site.article_url(1, 0)
+        stand_in_site.inject_faults('/article-1-0', [503, 503, 503, 503])
+
+        # act
+        response = client.get(url)
+        stats = client.retry_stats()[host_of(stand_in_site)]
+
+        # assert
+        assert response.status_code == 503
+        assert stand_in_site.hits['/article-1-0'] == 3
+        assert stats['retries'] == 2
+        assert stats['drops'] == 1
+
+    def test_retry_never_sleeps_past_the_deadline(self, stand_in_site):
+        # arrange
+        client = HttpClient(retry_policy=RetryPolicy(max_retries=3, backoff_max=30))
+        url = stand_in_site.article_url(1, 0)
+        stand_in_site.inject_faults('/article-1-0', [503, 503, 503, 503], retry_after=5)
+
+        # act
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.get(url, deadline=Deadline(1))
+        elapsed = time.monotonic() - started
+
+        # assert
+        assert elapsed < 1
+        assert stand_in_site.hits['/article-1-0'] == 1
+
+    def test_expired_deadline_never_counts_against_the_host(self, stand_in_site, client):
+        # arrange
+        url = stand_in_site.article_url(1, 0)
+
+        # act
+        for _ in range(5):
+            with pytest.raises(DeadlineExceeded):
+                client.get(url, deadline=Deadline(0))
+
+        # assert
+        breaker = client.breaker_for(url)
+        assert breaker.failures == 0
+        assert breaker.state == breaker.CLOSED
+        assert stand_in_site.hits['/article-1-0'] == 0
+
+    def test_retry_after_http_date_is_parsed(self):
+        # arrange
+        policy = RetryPolicy(backoff_max=30)
+
+        class Response:
+            headers = {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+        # act
+        delay = policy.retry_after(Response())
+
+        # assert
+        assert delay == 0.0
+
+
+class TestTokenBucket:
+
+    def test_requests_beyond_burst_are_paced(self):
+        # arrange
+        bucket = TokenBucket(rate=20, burst=2)
+
+        # act
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        # assert
+        assert elapsed >= 0.15
+
+    def test_acquire_gives_up_after_timeout(self):
+        # arrange
+        bucket = TokenBucket(rate=1, burst=1)
+        bucket.pause(5)
+
+        # act
+        started = time.monotonic()
+        waited = bucket.acquire(timeout=0.2)
+
+        # assert
+        assert waited is None
+        assert time.monotonic() - started < 0.2
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from django.core.cache import cache
+from utility.deadline import Deadline
+from utility.locks import CacheLock
+from utility.scrape_cache import ScrapeCache
+from utility.scraper import build_listing_url
+from utility.single_flight import SingleFlightTimeout
+
+
+@pytest.fixture
+def scrape_cache(stand_in_site, settings):
+    cache.clear()
+    settings.SCRAPER_BASE_URL = stand_in_site.base_url
+    stand_in_site.articles_per_page = 3
+    return ScrapeCache(ttl=60, stale_ttl=600)
+
+
+class TestScrapeCache:
+
+    def test_fresh_result_is_served_from_cache(self, scrape_cache, stand_in_site):
+        # arrange
+        scrape_cache.get_result(1, 'tech')
+
+        # act
+        news_items = scrape_cache.get_result(1, 'tech')['items']
+
+        # assert
+        assert len(news_items) == 3
+        assert stand_in_site.hits['/topic/tech/page/1'] == 1
+        assert sum(stand_in_site.article_hits().values()) == 3
+
+    def test_stale_result_is_served_while_refreshing(self, scrape_cache, stand_in_site, monkeypatch):
+        # arrange
+        scrape_cache.get_result(1, 'tech')
+        key = scrape_cache.make_key(1, 'tech')
+        entry = cache.get(key)
+        entry['fetched_at'] -= 120
+        cache.set(key, entry)
+        threads = []
+        refresh_in_background = scrape_cache.refresh_in_background
+        monkeypatch.setattr(scrape_cache, 'refresh_in_background',
+                            lambda *args: threads.append(refresh_in_background(*args)))
+
+        # act
+        news_items = scrape_cache.get_result(1, 'tech')['items']
+        threads[0].join(timeout=10)
+
+        # assert
+        assert [item.source for item in news_items] == [item.source for item in entry['items']]
+        assert stand_in_site.hits['/topic/tech/page/1'] == 2
+        assert cache.get(key)['fetched_at'] > entry['fetched_at']
+
+    def test_failed_scrape_is_not_cached(self, scrape_cache, stand_in_site):
+        # act
+        news_items = scrape_cache.get_result(99, 'tech')['items']
+
+        # assert
+        assert news_items == []
+        assert cache.get(scrape_cache.make_key(99, 'tech')) is None
+
+    def test_single_flight_timeout_serves_the_last_good_result(self, scrape_cache, monkeypatch):
+        # arrange
+        scrape_cache.get_result(1, 'tech')
+        cache.delete(scrape_cache.make_key(1, 'tech'))
+
+        def time_out(*args, **kwargs):
+            raise SingleFlightTimeout('Timed out')
+
+        monkeypatch.setattr('utility.scrape_cache.scrape_single_flight.do', time_out)
+
+        # act
+        result = scrape_cache.get_result(1, 'tech')
+
+        # assert
+        assert len(result['items']) == 3
+        assert result['stale'] is True
+        assert result['partial'] is True
+
+    def test_scrape_in_another_worker_is_not_waited_on_past_the_deadline(self, scrape_cache):
+        # arrange
+        other_worker = CacheLock(f"single-flight:{scrape_cache.make_key(2, 'tech')}")
+        other_worker.acquire()
+
+        # act
+        started = time.monotonic()
+        try:
+            result = scrape_cache.get_result(2, 'tech', deadline=Deadline(0.3))
+        finally:
+            elapsed = time.monotonic() - started
+            other_worker.release()
+
+        # assert
+        assert elapsed < 1
+        assert result['items'] == []
+        assert result['partial'] is True
+        assert result['skipped_urls'] == [build_listing_url(2, 'tech')]
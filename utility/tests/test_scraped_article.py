@@ -0,0 +1,30 @@
+import pickle
+
+from utility.scraped_article import ScrapedArticle, compute_content_hash
+
+
+class TestScrapedArticle:
+
+    def test_derived_fields_are_computed_once(self):
+        # act
+        article = ScrapedArticle(title='Apple Chip', text='متن کامل', source='https://digiato.com/a', tags=('فناوری',))
+
+        # assert
+        assert not hasattr(article, '__dict__')
+        assert article.normalized_text == 'apple chip\x00متن کامل'
+        assert article.content_hash == compute_content_hash('Apple Chip', 'متن کامل')
+        assert article.tags == ['فناوری']
+        assert article.published_at is not None
+
+    def test_round_trips_through_dict_and_pickle(self):
+        # arrange
+        article = ScrapedArticle(title='عنوان', text='متن', source='https://digiato.com/a', tags=['ai'])
+
+        # act
+        from_dict = ScrapedArticle.from_dict(article.as_dict())
+        unpickled = pickle.loads(pickle.dumps(article))
+
+        # assert
+        for copy in (from_dict, unpickled):
+            assert copy.as_dict() == article.as_dict()
+            assert copy.content_hash == article.content_hash
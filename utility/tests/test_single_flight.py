@@ -0,0 +1,110 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import cache
+from utility.deadline import Deadline
+from utility.locks import CacheLock
+from utility.single_flight import SingleFlight, SingleFlightTimeout
+
+
+class TestSingleFlight:
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_concurrent_calls_share_one_execution(self):
+        # arrange
+        single_flight = SingleFlight()
+        calls = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'result'
+
+        # act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: single_flight.do('key', work), range(8)))
+
+        # assert
+        assert results == ['result'] * 8
+        assert len(calls) == 1
+
+    def test_other_worker_waits_and_loads_stored_result(self):
+        # arrange
+        other_worker = SingleFlight(poll_interval=0.01)
+        stored = {}
+        lock = CacheLock('single-flight:key')
+        lock.acquire()
+
+        def finish_elsewhere():
+            time.sleep(0.1)
+            stored['value'] = 'from other worker'
+            lock.release()
+
+        threading.Thread(target=finish_elsewhere).start()
+
+        # act
+        result = other_worker.do('key', lambda: 'ran locally', load=lambda: stored.get('value'))
+
+        # assert
+        assert result == 'from other worker'
+
+    def test_waiting_caller_times_out_with_an_error(self):
+        # arrange
+        single_flight = SingleFlight(timeout=0.1)
+        release = threading.Event()
+        leader = threading.Thread(target=single_flight.do, args=('key', lambda: release.wait(5)))
+        leader.start()
+        time.sleep(0.05)
+
+        # act / assert
+        try:
+            with pytest.raises(SingleFlightTimeout):
+                single_flight.do('key', lambda: 'never runs')
+        finally:
+            release.set()
+            leader.join()
+
+    def test_waiting_caller_gives_up_at_its_deadline(self):
+        # arrange
+        single_flight = SingleFlight(timeout=5)
+        release = threading.Event()
+        leader = threading.Thread(target=single_flight.do, args=('key', lambda: release.wait(5)))
+        leader.start()
+        time.sleep(0.05)
+
+        # act
+        started = time.monotonic()
+        try:
+            with pytest.raises(SingleFlightTimeout):
+                single_flight.do('key', lambda: 'never runs', deadline=Deadline(0.2))
+        finally:
+            elapsed = time.monotonic() - started
+            release.set()
+            leader.join()
+
+        # assert
+        assert elapsed < 1
+
+    def test_other_worker_gives_up_at_its_deadline(self):
+        # arrange
+        other_worker = SingleFlight(timeout=5, poll_interval=0.01)
+        lock = CacheLock('single-flight:key')
+        lock.acquire()
+        calls = []
+
+        # act
+        started = time.monotonic()
+        try:
+            with pytest.raises(SingleFlightTimeout):
+                other_worker.do('key', lambda: calls.append(1), deadline=Deadline(0.2))
+        finally:
+            elapsed = time.monotonic() - started
+            lock.release()
+
+        # assert
+        assert elapsed < 1
+        assert calls == []
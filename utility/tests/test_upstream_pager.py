@@ -0,0 +1,93 @@
+import pytest
+from utility.deadline import Deadline
+from utility.upstream_pager import UpstreamPager, encode_cursor, decode_cursor
+
+
+class FakeScrapeCache:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def get_result(self, page_number, topic, deadline=None):
+        self.requested.append(page_number)
+        return {'items': self.pages.get(page_number, []), 'stale': False, 'fetched_at': 0,
+                'partial': False, 'skipped_urls': []}
+
+
+class TestUpstreamPager:
+
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor(3, 7, 2)) == (3, 7, 2)
+
+    @pytest.mark.parametrize('cursor', ['', 'garbage', encode_cursor(0, 0, 1)])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_pulls_only_the_pages_it_needs(self):
+        # arrange
+        scrape_cache = FakeScrapeCache({1: [1, 2, 3], 2: [4, 5, 6], 3: [7, 8, 9]})
+        pager = UpstreamPager(item_filter=lambda item: item % 2 == 0, scrape_cache=scrape_cache)
+
+        # act
+        collected = pager.collect(2)
+
+        # assert
+        assert collected['items'] == [2, 4]
+        assert collected['next_position'] == (2, 1)
+        assert scrape_cache.requested == [1, 2]
+
+    def test_resumes_from_position_until_exhausted(self):
+        # arrange
+        scrape_cache = FakeScrapeCache({1: [1, 2, 3], 2: [4, 5, 6]})
+        pager = UpstreamPager(scrape_cache=scrape_cache)
+
+        # act
+        collected = pager.collect(10, upstream_page=2, offset=1)
+
+        # assert
+        assert collected['items'] == [5, 6]
+        assert collected['exhausted'] is True
+        assert collected['next_position'] is None
+
+    def test_stops_at_the_page_limit(self):
+        # arrange
+        scrape_cache = FakeScrapeCache({n: [n] for n in range(1, 20)})
+        pager = UpstreamPager(max_pages=3, scrape_cache=scrape_cache)
+
+        # act
+        collected = pager.collect(10)
+
+        # assert
+        assert collected['items'] == [1, 2, 3]
+        assert collected['next_position'] == (4, 0)
+        assert collected['truncated'] is True
+        assert collected['partial'] is False
+
+    def test_expired_deadline_marks_the_result_partial(self):
+        # arrange
+        scrape_cache = FakeScrapeCache({n: [n] for n in range(1, 20)})
+        pager = UpstreamPager(deadline=Deadline(0), scrape_cache=scrape_cache)
+
+        # act
+        collected = pager.collect(10)
+
+        # assert
+        assert collected['items'] == []
+        assert collected['next_position'] == (1, 0)
+        assert collected['partial'] is True
+        assert collected['truncated'] is False
+
+    def test_unbounded_collect_reads_the_whole_listing(self):
+        # arrange
+        scrape_cache = FakeScrapeCache({1: [1, 2, 3], 2: [4, 5, 6]})
+        pager = UpstreamPager(scrape_cache=scrape_cache)
+
+        # act
+        collected = pager.collect(None)
+
+        # assert
+        assert collected['items'] == [1, 2, 3, 4, 5, 6]
+        assert collected['exhausted'] is True
+        assert collected['truncated'] is False
+        assert collected['partial'] is False
@@ -0,0 +1,139 @@
+import base64
+import binascii
+import json
+import logging
+from django.conf import settings
+from utility.http_client import CircuitOpenError
+from utility.scrape_cache import ScrapeCache
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(upstream_page, offset, page_number):
+    """
+    Encode an upstream position as an opaque cursor
+
+    Args:
+        upstream_page: Digiato listing page to resume from
+        offset: Index of the first unread item on that listing page
+        page_number: API page number the cursor points to
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({'u': upstream_page, 'o': offset, 'p': page_number}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor made by encode_cursor
+
+    Returns:
+        Tuple of (upstream_page, offset, page_number)
+
+    Raises:
+        ValueError: The cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        position = int(payload['u']), int(payload['o']), int(payload['p'])
+    except (binascii.Error, UnicodeError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        raise ValueError('Invalid cursor')
+    if position[0] < 1 or position[1] < 0 or position[2] < 1:
+        raise ValueError('Invalid cursor')
+    return position
+
+
+class UpstreamPager:
+    """
+    Fills API pages by pulling Digiato listing pages lazily.
+
+    Listing pages are read in order through the scrape cache, items that do not
+    pass item_filter are dropped, and pulling stops as soon as the requested
+    number of items is collected. The position reached, a listing page and an
+    offset inside it, lets the next request resume where this one stopped.
+    """
+
+    def __init__(self, topic="tech", item_filter=None, deadline=None, max_pages=None, scrape_cache=None):
+        self.topic = topic
+        self.item_filter = item_filter
+        self.deadline = deadline
+        self.max_pages = max_pages or getattr(settings, 'SCRAPER_MAX_UPSTREAM_PAGES', 10)
+        self.scrape_cache = scrape_cache or ScrapeCache()
+
+    def collect(self, size, upstream_page=1, offset=0):
+        """
+        Collect up to size filtered items starting at an upstream position
+
+        Args:
+            size: Number of items wanted, None to read until the listing is exhausted
+            upstream_page: Listing page to start from
+            offset: Index of the first item to read on that listing page
+
+        Returns:
+            Dictionary with 'items', 'next_position' (upstream_page, offset) or None
+            when the listing is exhausted, 'exhausted', 'pulled_pages', 'truncated'
+            (pulling stopped at max_pages), 'partial' (the deadline ran out or
+            fetches failed), 'skipped_urls', 'stale' and 'fetched_at' (oldest
+            stale page)
+
+        Raises:
+            CircuitOpenError: The upstream is unavailable and the first page was never scraped
+        """
+        collected = {
+            'items': [], 'next_position': None, 'exhausted': False, 'pulled_pages': 0, 'truncated': False,
+            'partial': False, 'skipped_urls': [], 'stale': False, 'fetched_at': None,
+        }
+        items = collected['items']
+
+        while True:
+            if self.deadline is not None and self.deadline.expired():
+                collected.update(next_position=(upstream_page, offset), partial=True)
+                return collected
+            if collected['pulled_pages'] >= self.max_pages:
+                collected.update(next_position=(upstream_page, offset), truncated=True)
+                return collected
+
+            try:
+                result = self.scrape_cache.get_result(upstream_page, self.topic, deadline=self.deadline)
+            except CircuitOpenError:
+                if not items:
+                    raise
+                collected.update(next_position=(upstream_page, offset), partial=True)
+                return collected
+
+            collected['pulled_pages'] += 1
+            if result['stale']:
+                collected['stale'] = True
+                collected['fetched_at'] = min(filter(None, [collected['fetched_at'], result['fetched_at']]))
+            collected['skipped_urls'].extend(result['skipped_urls'])
+            page_items = result['items']
+
+            if not page_items:
+                if result['partial']:
+                    # The listing page itself could not be fetched in time
+                    collected.update(next_position=(upstream_page, offset), partial=True)
+                else:
+                    collected['exhausted'] = True
+                return collected
+
+            for index in range(offset, len(page_items)):
+                if size is not None and len(items) == size:
+                    collected['next_position'] = (upstream_page, index)
+                    return collected
+                item = page_items[index]
+                if self.item_filter is None or self.item_filter(item):
+                    items.append(item)
+
+            upstream_page, offset = upstream_page + 1, 0
+
+            if result['partial']:
+                # The rest of this listing page could not be fetched in time
+                collected.update(next_position=(upstream_page, offset), partial=True)
+                return collected
+
+            if size is not None and len(items) == size:
+                collected['next_position'] = (upstream_page, offset)
+                return collected